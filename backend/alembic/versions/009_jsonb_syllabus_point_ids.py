@@ -0,0 +1,55 @@
+"""switch questions.syllabus_point_ids to JSONB with GIN index
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-08-29
+
+Changes:
+- Convert questions.syllabus_point_ids from JSON to JSONB
+- Add GIN index (jsonb_path_ops) so syllabus point containment filters
+  in SearchService.search_questions use an index scan instead of a
+  sequential scan over all questions
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '009_jsonb'
+down_revision = '008_pointer'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Convert syllabus_point_ids to JSONB and index it with GIN.
+
+    jsonb_path_ops supports the @> containment operator used by the
+    syllabus point filter (smaller and faster than the default opclass).
+    """
+    op.alter_column(
+        'questions',
+        'syllabus_point_ids',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='syllabus_point_ids::jsonb',
+    )
+    op.create_index(
+        'ix_questions_syllabus_point_ids_gin',
+        'questions',
+        ['syllabus_point_ids'],
+        postgresql_using='gin',
+        postgresql_ops={'syllabus_point_ids': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Drop the GIN index and revert the column to plain JSON."""
+    op.drop_index('ix_questions_syllabus_point_ids_gin', table_name='questions')
+    op.alter_column(
+        'questions',
+        'syllabus_point_ids',
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        postgresql_using='syllabus_point_ids::json',
+    )
@@ -0,0 +1,51 @@
+"""add pg_trgm GIN indexes for ILIKE text search
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-08-29
+
+Changes:
+- Enable the pg_trgm extension
+- Add trigram GIN indexes on questions.question_text and
+  mark_schemes.mark_scheme_text so the ILIKE '%term%' filters in
+  SearchService run as index scans instead of sequential scans
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010_trgm'
+down_revision = '009_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create trigram indexes backing the case-insensitive text search.
+
+    gin_trgm_ops supports ILIKE with leading wildcards, which a btree
+    index cannot serve; both search_questions and search_mark_schemes
+    filter with %term% patterns.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_questions_question_text_trgm',
+        'questions',
+        ['question_text'],
+        postgresql_using='gin',
+        postgresql_ops={'question_text': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_mark_schemes_mark_scheme_text_trgm',
+        'mark_schemes',
+        ['mark_scheme_text'],
+        postgresql_using='gin',
+        postgresql_ops={'mark_scheme_text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (extension left in place)."""
+    op.drop_index('ix_mark_schemes_mark_scheme_text_trgm', table_name='mark_schemes')
+    op.drop_index('ix_questions_question_text_trgm', table_name='questions')
@@ -6,7 +6,7 @@ LLM clients and fallback orchestration for Phase III AI Teaching Roles.
 from .anthropic_client import AnthropicClient
 from .openai_client import OpenAIClient
 from .gemini_client import GeminiClient
-from .llm_fallback import LLMFallbackOrchestrator, LLMProvider
+from .llm_fallback import LLMFallbackOrchestrator, LLMProvider, get_llm_orchestrator
 
 __all__ = [
     "AnthropicClient",
@@ -14,4 +14,5 @@ __all__ = [
     "GeminiClient",
     "LLMFallbackOrchestrator",
     "LLMProvider",
+    "get_llm_orchestrator",
 ]
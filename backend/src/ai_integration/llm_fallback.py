@@ -14,6 +14,7 @@ Constitutional Requirements:
 
 import asyncio
 import logging
+import threading
 from typing import Optional, Callable, Any
 from enum import Enum
 
@@ -25,14 +26,19 @@ from .gemini_client import GeminiClient
 logger = logging.getLogger(__name__)
 
 
-class LLMProvider(Enum):
-    """Enum for LLM providers"""
+class LLMProvider(str, Enum):
+    """Enum for LLM providers
+
+    Inherits from str so members can be used directly where a plain
+    provider string is expected (logging, generated_by fields) without
+    going through the .value descriptor.
+    """
     ANTHROPIC = "anthropic"
     OPENAI = "openai"
     GEMINI = "gemini"
 
 
-class CircuitBreakerState(Enum):
+class CircuitBreakerState(str, Enum):
     """Circuit breaker states"""
     CLOSED = "closed"  # Normal operation
     OPEN = "open"      # Failing, use fallback
@@ -252,3 +258,25 @@ class LLMFallbackOrchestrator:
             available.append("Gemini")
 
         return f"<LLMFallbackOrchestrator(providers={', '.join(available)})>"
+
+
+# Process-wide orchestrator shared across requests so provider HTTP
+# connection pools are reused and circuit breaker state survives between
+# calls (a fresh orchestrator per request would reset both)
+_orchestrator: Optional[LLMFallbackOrchestrator] = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_llm_orchestrator() -> LLMFallbackOrchestrator:
+    """
+    Return the shared LLM fallback orchestrator, creating it on first use.
+
+    Returns:
+        LLMFallbackOrchestrator: Process-wide orchestrator instance
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = LLMFallbackOrchestrator()
+    return _orchestrator
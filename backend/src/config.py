@@ -45,6 +45,11 @@ class Settings(BaseSettings):
         description="JWT token expiration in minutes",
     )
 
+    bcrypt_rounds: int = Field(
+        default=12,  # Work factor 12 (constitutional requirement)
+        description="bcrypt work factor (tests lower this for speed)",
+    )
+
     # Application Configuration
     environment: str = Field(
         default="development",
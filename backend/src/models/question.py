@@ -15,6 +15,7 @@ from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy import JSON, Column, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
@@ -137,10 +138,11 @@ class Question(SQLModel, table=True):
         description="Detailed marking criteria (levels, points, rubrics) - Phase III",
     )
 
-    # Phase II US7: Syllabus Tagging (JSON - compatible with SQLite for testing, uses ARRAY in PostgreSQL in production)
+    # Phase II US7: Syllabus Tagging (JSON in SQLite for testing, JSONB in PostgreSQL
+    # so containment filters use the GIN jsonb_path_ops index - see migration 009)
     syllabus_point_ids: list[str] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSON().with_variant(JSONB(), "postgresql")),
         description="Array of syllabus point UUIDs for tagging",
     )
 
@@ -15,8 +15,33 @@ Architecture Decision AD-002: Generic Extraction Framework
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
+# Collapse multiple blank lines (hoisted: compiled once at import)
+_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n")
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """
+    Compile and cache a regex pattern
+
+    Subject-specific patterns arrive as strings (from the subject's
+    extraction_patterns JSONB), so they can't be compiled at import
+    time. The stdlib re module caches compilations too, but its cache
+    is capped at 512 entries and pays a lookup on every call; this
+    unbounded cache keeps each distinct pattern compiled exactly once.
+
+    Args:
+        pattern: Regex pattern string
+        flags: Regex flags (e.g., re.IGNORECASE)
+
+    Returns:
+        re.Pattern: Compiled pattern
+    """
+    return re.compile(pattern, flags)
+
 
 def split_by_delimiter(text: str, delimiter_pattern: str, flags: int = re.MULTILINE) -> list[str]:
     """
@@ -36,7 +61,7 @@ def split_by_delimiter(text: str, delimiter_pattern: str, flags: int = re.MULTIL
         >>> len(chunks)
         3  # [intro, Q1 text, Q2 text]
     """
-    split_result = re.split(delimiter_pattern, text, flags=flags)
+    split_result = _compile(delimiter_pattern, flags).split(text)
 
     # If delimiter pattern has capturing group, re.split returns alternating chunks:
     # [header, delimiter1, text1, delimiter2, text2, ...]
@@ -69,7 +94,7 @@ def extract_marks(text: str, marks_pattern: str) -> int | None:
         >>> extract_marks("Define GDP.", r"\\[(\\d+)\\s+marks?\\]")
         None
     """
-    match = re.search(marks_pattern, text, re.IGNORECASE)
+    match = _compile(marks_pattern, re.IGNORECASE).search(text)
     if match:
         return int(match.group(1))
     return None
@@ -100,10 +125,10 @@ def remove_headers_footers(text: str, patterns: list[dict[str, Any]]) -> str:
     for pattern_dict in patterns:
         pattern = pattern_dict.get("pattern", "")
         if pattern:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.MULTILINE | re.IGNORECASE)
+            cleaned = _compile(pattern, re.MULTILINE | re.IGNORECASE).sub("", cleaned)
 
     # Remove excessive whitespace
-    cleaned = re.sub(r"\n\s*\n", "\n\n", cleaned)  # Collapse multiple blank lines
+    cleaned = _BLANK_LINES_PATTERN.sub("\n\n", cleaned)  # Collapse multiple blank lines
     cleaned = cleaned.strip()
 
     return cleaned
@@ -127,7 +152,7 @@ def detect_diagram_reference(text: str, indicators: list[str]) -> bool:
         False
     """
     for indicator in indicators:
-        if re.search(indicator, text, re.IGNORECASE):
+        if _compile(indicator, re.IGNORECASE).search(text):
             return True
     return False
 
@@ -153,7 +178,7 @@ def extract_question_number(text: str, delimiter_pattern: str) -> int | None:
     if "(" not in delimiter_pattern:
         delimiter_pattern = delimiter_pattern.replace(r"\d+", r"(\d+)")
 
-    match = re.search(delimiter_pattern, text, re.IGNORECASE)
+    match = _compile(delimiter_pattern, re.IGNORECASE).search(text)
     if match:
         try:
             return int(match.group(1))
@@ -182,7 +207,7 @@ def extract_subparts(text: str, subpart_pattern: str) -> list[dict[str, Any]]:
         '(a)'
     """
     subparts = []
-    matches = list(re.finditer(subpart_pattern, text, re.IGNORECASE))
+    matches = list(_compile(subpart_pattern, re.IGNORECASE).finditer(text))
 
     for i, match in enumerate(matches):
         label = match.group(0)
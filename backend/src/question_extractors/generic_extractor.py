@@ -32,6 +32,11 @@ from src.models.subject import Subject
 from src.question_extractors import extraction_patterns as ep
 from src.question_extractors.cambridge_parser import CambridgeFilenameParser
 
+# Hoisted literal patterns (compiled once at import, off the per-question path)
+_LEADING_DIGIT_PATTERN = re.compile(r"^\d+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n")
+
 
 class ExtractionError(Exception):
     """Raised when PDF extraction fails"""
@@ -215,7 +220,7 @@ class GenericExtractor:
         chunks = ep.split_by_delimiter(text, delimiter_pattern)
 
         # Remove first chunk if it's header/introduction
-        if chunks and not re.search(r"^\d+", chunks[0].strip()):
+        if chunks and not _LEADING_DIGIT_PATTERN.search(chunks[0].strip()):
             chunks = chunks[1:]
 
         return chunks
@@ -370,8 +375,8 @@ class GenericExtractor:
             str: Cleaned text
         """
         # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text)
-        text = re.sub(r"\n\s*\n", "\n\n", text)
+        text = _WHITESPACE_PATTERN.sub(" ", text)
+        text = _BLANK_LINES_PATTERN.sub("\n\n", text)
         text = text.strip()
 
         return text
@@ -33,7 +33,7 @@ from src.services.coaching_service import (
     SessionNotFoundError,
     LLMResponseError,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import get_llm_orchestrator
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ async def create_tutoring_session(
 
     try:
         # Create LLM orchestrator for this request
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
         # Call coaching service with fallback orchestration
         response = await start_tutoring_session(
@@ -201,7 +201,7 @@ async def respond_in_session(
 
     try:
         # Create LLM orchestrator for this request
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
         # Call coaching service with fallback orchestration
         response = await respond_to_coach(
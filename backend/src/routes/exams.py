@@ -242,8 +242,7 @@ def get_exam(
     Examples:
         GET /api/exams/123e4567-e89b-12d3-a456-426614174000
     """
-    stmt = select(Exam).where(Exam.id == exam_id)
-    exam = db.exec(stmt).first()
+    exam = db.get(Exam, exam_id)
 
     if not exam:
         raise HTTPException(
@@ -374,8 +373,7 @@ def update_exam_status(
         )
 
     # Get exam
-    stmt = select(Exam).where(Exam.id == exam_id)
-    exam = db.exec(stmt).first()
+    exam = db.get(Exam, exam_id)
 
     if not exam:
         raise HTTPException(
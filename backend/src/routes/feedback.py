@@ -33,7 +33,7 @@ from src.services.review_service import (
     AttemptedQuestionNotFoundError,
     LLMResponseError,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import get_llm_orchestrator
 
 logger = logging.getLogger(__name__)
 
@@ -144,7 +144,7 @@ async def analyze_weaknesses_endpoint(
 
     try:
         # Create LLM orchestrator for this request
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
         # Call review service with fallback orchestration
         report = await analyze_weaknesses(
@@ -251,7 +251,7 @@ async def generate_model_answer_endpoint(
 
     try:
         # Create LLM orchestrator for this request
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
         # Call review service with fallback orchestration
         model = await generate_model_answer(
@@ -33,7 +33,7 @@ from src.services.marking_service import (
     MarkSchemeNotFoundError,
     LLMResponseError,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import get_llm_orchestrator
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +118,7 @@ async def mark_answer_endpoint(
 
     try:
         # Create LLM orchestrator for this request
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
         # Call marking service with fallback orchestration
         result = await mark_answer(
@@ -223,7 +223,7 @@ async def mark_attempt_endpoint(
 
     try:
         # Create LLM orchestrator for this request
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
         # Call marking service with fallback orchestration
         result = await mark_attempt(
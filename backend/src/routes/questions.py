@@ -143,10 +143,8 @@ async def upload_pdf(
                 str(file_path), subject.id, subject.extraction_patterns
             )
 
-            # Save questions to database
-            for question in questions:
-                session.add(question)
-
+            # Save questions to database in one batch
+            session.add_all(questions)
             session.commit()
 
             return {
@@ -314,9 +314,8 @@ def add_question_tags(
             ]
         }
     """
-    # Get question
-    stmt = select(Question).where(Question.id == question_id)
-    question = db.exec(stmt).first()
+    # Get question (primary-key lookup)
+    question = db.get(Question, question_id)
 
     if not question:
         raise HTTPException(
@@ -337,8 +336,9 @@ def add_question_tags(
     # Get current tags (or initialize empty list)
     current_tags = question.syllabus_point_ids if question.syllabus_point_ids else []
 
-    # Add new tags (avoid duplicates)
-    new_tags = list(set(current_tags + request.syllabus_point_ids))
+    # Add new tags (avoid duplicates; dict.fromkeys dedups in one pass
+    # while keeping insertion order stable, unlike set())
+    new_tags = list(dict.fromkeys(current_tags + request.syllabus_point_ids))
 
     # Update question
     question.syllabus_point_ids = new_tags
@@ -367,9 +367,8 @@ def remove_question_tag(
     Examples:
         DELETE /api/syllabus/questions/123e4567-e89b-12d3-a456-426614174000/tags/789e4567-e89b-12d3-a456-426614174000
     """
-    # Get question
-    stmt = select(Question).where(Question.id == question_id)
-    question = db.exec(stmt).first()
+    # Get question (primary-key lookup)
+    question = db.get(Question, question_id)
 
     if not question:
         raise HTTPException(
@@ -380,17 +379,19 @@ def remove_question_tag(
     # Get current tags
     current_tags = question.syllabus_point_ids if question.syllabus_point_ids else []
 
-    # Remove tag (if exists)
+    # Remove tag (if exists): try/except makes one pass over the list
+    # instead of a membership scan followed by a remove scan
     syllabus_point_id_str = str(syllabus_point_id)
-    if syllabus_point_id_str in current_tags:
+    try:
         current_tags.remove(syllabus_point_id_str)
+    except ValueError:
+        removed = False
+    else:
         question.syllabus_point_ids = current_tags
         db.add(question)
         db.commit()
         db.refresh(question)
         removed = True
-    else:
-        removed = False
 
     return {
         "question_id": str(question.id),
@@ -412,9 +413,8 @@ def get_question_tags(
     Examples:
         GET /api/syllabus/questions/123e4567-e89b-12d3-a456-426614174000/tags
     """
-    # Get question
-    stmt = select(Question).where(Question.id == question_id)
-    question = db.exec(stmt).first()
+    # Get question (primary-key lookup)
+    question = db.get(Question, question_id)
 
     if not question:
         raise HTTPException(
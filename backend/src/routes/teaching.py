@@ -30,7 +30,7 @@ from src.services.teaching_service import (
     StudentNotFoundError,
     LLMResponseError,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import get_llm_orchestrator
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +106,7 @@ async def explain_concept_endpoint(
     try:
         # Create LLM orchestrator for this request
         # (reuses same instance for potential retries)
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
         # Call teaching service with fallback orchestration
         explanation = await explain_concept(
@@ -11,12 +11,16 @@ Constitutional Requirements:
 
 from passlib.context import CryptContext
 
-# Password hashing context (bcrypt with work factor 12)
-# Constitutional requirement: Work factor 12 balances security and performance
+from src.config import settings
+
+# Password hashing context (bcrypt, work factor from settings)
+# Constitutional requirement: default work factor 12 balances security
+# and performance; tests lower BCRYPT_ROUNDS so hashing is not the
+# dominant cost of the suite
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12,  # Work factor 12 (constitutional requirement)
+    bcrypt__rounds=settings.bcrypt_rounds,
 )
 
 
@@ -32,7 +32,7 @@ from src.schemas.coaching_schemas import (
     SessionNotes,
     SessionMessage,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import LLMFallbackOrchestrator, get_llm_orchestrator
 from src.ai_integration.prompt_templates.coach_prompts import (
     CoachPrompts,
     create_tutoring_prompt,
@@ -131,7 +131,7 @@ async def start_tutoring_session(
 
     # Step 4: Call LLM with fallback orchestration
     if llm_orchestrator is None:
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
     try:
         logger.info(
@@ -308,7 +308,7 @@ async def respond_to_coach(
 
     # Step 4: Call LLM with fallback
     if llm_orchestrator is None:
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
     try:
         logger.info(
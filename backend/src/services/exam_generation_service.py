@@ -369,19 +369,18 @@ class ExamGenerationService:
         if not exam:
             raise ExamGenerationError(f"Exam {exam_id} not found")
 
-        # Get questions (preserve order)
+        # Get questions in a single IN query (one round-trip instead of
+        # one per question), then restore the exam's stored order
         question_ids = exam.question_ids if exam.question_ids else []
-        questions = []
+        if not question_ids:
+            return []
 
-        for qid in question_ids:
-            stmt_q = select(Question).where(Question.id == UUID(qid))
-            result_q = self.db.exec(stmt_q)
-            q = result_q.scalars().first()
-
-            if q:
-                questions.append(q)
+        stmt_q = select(Question).where(
+            Question.id.in_([UUID(qid) for qid in question_ids])
+        )
+        questions_by_id = {str(q.id): q for q in self.db.exec(stmt_q).scalars()}
 
-        return questions
+        return [questions_by_id[qid] for qid in question_ids if qid in questions_by_id]
 
     def get_exam_statistics(self, exam_id: UUID) -> dict[str, Any]:
         """
@@ -30,7 +30,7 @@ from src.schemas.marking_schemas import (
     MarkingError,
     MarkedPoint,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import LLMFallbackOrchestrator, get_llm_orchestrator
 from src.ai_integration.prompt_templates.marker_prompts import MarkerPrompts
 from src.algorithms.confidence_scoring import ConfidenceScorer
 
@@ -139,7 +139,7 @@ async def mark_answer(
 
     # Step 4: Call LLM with fallback orchestration
     if llm_orchestrator is None:
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
     try:
         logger.info(
@@ -315,7 +315,7 @@ async def mark_attempt(
 
     # Step 3: Mark each question individually
     if llm_orchestrator is None:
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
     question_results: List[MarkingResult] = []
     total_marks = 0
@@ -417,18 +417,23 @@ async def mark_attempt(
     )
 
 
+# Cambridge Economics 9708 Grade Boundaries (typical), highest first
+_GRADE_BOUNDARIES: List[tuple[float, str]] = [
+    (90, "A*"),
+    (80, "A"),
+    (70, "B"),
+    (60, "C"),
+    (50, "D"),
+    (40, "E"),
+]
+
+
 def _calculate_grade(percentage: float) -> str:
     """
     Calculate Cambridge A-Level grade from percentage.
 
-    Cambridge Economics 9708 Grade Boundaries (typical):
-    - A*: 90%+
-    - A: 80-89%
-    - B: 70-79%
-    - C: 60-69%
-    - D: 50-59%
-    - E: 40-49%
-    - U: <40%
+    Looks up the grade in _GRADE_BOUNDARIES (single table scan instead of
+    a comparison ladder); anything below the lowest boundary is "U".
 
     Args:
         percentage: Overall percentage score
@@ -436,20 +441,10 @@ def _calculate_grade(percentage: float) -> str:
     Returns:
         Letter grade
     """
-    if percentage >= 90:
-        return "A*"
-    elif percentage >= 80:
-        return "A"
-    elif percentage >= 70:
-        return "B"
-    elif percentage >= 60:
-        return "C"
-    elif percentage >= 50:
-        return "D"
-    elif percentage >= 40:
-        return "E"
-    else:
-        return "U"
+    for boundary, grade in _GRADE_BOUNDARIES:
+        if percentage >= boundary:
+            return grade
+    return "U"
 
 
 def _generate_overall_feedback(
@@ -19,6 +19,7 @@ from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import date, datetime, timedelta
 
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from src.models.study_plan import StudyPlan
@@ -117,16 +118,14 @@ async def create_study_plan(
         8. Return StudyPlanResponse
     """
 
-    # Step 1: Validate student exists
-    statement = select(Student).where(Student.id == request.student_id)
-    student = session.exec(statement).first()
+    # Step 1: Validate student exists (primary-key lookup)
+    student = session.get(Student, request.student_id)
 
     if not student:
         raise StudentNotFoundError(f"Student {request.student_id} not found")
 
-    # Step 2: Validate subject exists
-    statement = select(Subject).where(Subject.id == request.subject_id)
-    subject = session.exec(statement).first()
+    # Step 2: Validate subject exists (primary-key lookup)
+    subject = session.get(Subject, request.subject_id)
 
     if not subject:
         raise SubjectNotFoundError(f"Subject {request.subject_id} not found")
@@ -145,16 +144,17 @@ async def create_study_plan(
             f"Exam date {request.exam_date} is too soon (minimum 7 days required)"
         )
 
-    # Step 4: Fetch all syllabus points for subject
-    statement = select(SyllabusPoint).where(SyllabusPoint.subject_id == request.subject_id)
-    syllabus_points_db = session.exec(statement).all()
+    # Step 4: Fetch syllabus point codes for subject (only column the plan needs)
+    statement = select(SyllabusPoint.code).where(
+        SyllabusPoint.subject_id == request.subject_id
+    )
+    syllabus_points = session.exec(statement).all()
 
-    if not syllabus_points_db:
+    if not syllabus_points:
         logger.warning(f"No syllabus points found for subject {request.subject_id}")
         # Create empty plan
         return _create_empty_plan(session, request, subject)
 
-    syllabus_points = [sp.code for sp in syllabus_points_db]
     total_syllabus_points = len(syllabus_points)
 
     logger.info(
@@ -417,16 +417,14 @@ def get_study_plan(
         - Principle V: Multi-tenant isolation (plan belongs to student)
     """
 
-    # Fetch study plan
-    statement = select(StudyPlan).where(StudyPlan.id == plan_id)
-    study_plan = session.exec(statement).first()
+    # Fetch study plan (by primary key)
+    study_plan = session.get(StudyPlan, plan_id)
 
     if not study_plan:
         raise StudyPlanNotFoundError(f"Study plan {plan_id} not found")
 
-    # Fetch subject for code
-    statement = select(Subject).where(Subject.id == study_plan.subject_id)
-    subject = session.exec(statement).first()
+    # Fetch subject for code (by primary key)
+    subject = session.get(Subject, study_plan.subject_id)
 
     if not subject:
         raise SubjectNotFoundError(f"Subject {study_plan.subject_id} not found")
@@ -451,9 +449,11 @@ def get_study_plan(
     for day in schedule:
         covered_topics.update(day.topics)
 
-    # Fetch total syllabus points for subject
-    statement = select(SyllabusPoint).where(SyllabusPoint.subject_id == study_plan.subject_id)
-    total_syllabus_points = len(session.exec(statement).all())
+    # Count syllabus points for subject (no need to hydrate full rows)
+    statement = select(func.count(SyllabusPoint.id)).where(
+        SyllabusPoint.subject_id == study_plan.subject_id
+    )
+    total_syllabus_points = session.exec(statement).one()
 
     syllabus_coverage = (len(covered_topics) / total_syllabus_points * 100) if total_syllabus_points > 0 else 100.0
 
@@ -512,9 +512,8 @@ def update_progress(
         8. Return ProgressUpdate
     """
 
-    # Step 1: Fetch study plan
-    statement = select(StudyPlan).where(StudyPlan.id == plan_id)
-    study_plan = session.exec(statement).first()
+    # Step 1: Fetch study plan (by primary key)
+    study_plan = session.get(StudyPlan, plan_id)
 
     if not study_plan:
         raise StudyPlanNotFoundError(f"Study plan {plan_id} not found")
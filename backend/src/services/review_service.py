@@ -38,7 +38,7 @@ from src.schemas.feedback_schemas import (
     MarksBreakdown,
     WhyThisIsAStar,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import LLMFallbackOrchestrator, get_llm_orchestrator
 from src.ai_integration.prompt_templates.reviewer_prompts import ReviewerPrompts
 
 logger = logging.getLogger(__name__)
@@ -114,9 +114,8 @@ async def analyze_weaknesses(
         7. Return WeaknessReport
     """
 
-    # Step 1: Fetch attempt from database
-    statement = select(Attempt).where(Attempt.id == request.attempt_id)
-    attempt = session.exec(statement).first()
+    # Step 1: Fetch attempt from database (by primary key)
+    attempt = session.get(Attempt, request.attempt_id)
 
     if not attempt:
         raise AttemptNotFoundError(f"Attempt {request.attempt_id} not found")
@@ -128,11 +127,17 @@ async def analyze_weaknesses(
     attempted_questions = session.exec(statement).all()
 
     # Step 3: Build attempted questions data for prompt
+    # Fetch all referenced questions in one IN query (avoids a
+    # per-attempted-question SELECT)
+    question_ids = {aq.question_id for aq in attempted_questions}
+    questions_by_id: dict = {}
+    if question_ids:
+        statement = select(Question).where(Question.id.in_(question_ids))
+        questions_by_id = {q.id: q for q in session.exec(statement).all()}
+
     attempted_questions_data = []
     for aq in attempted_questions:
-        # Fetch question details
-        statement = select(Question).where(Question.id == aq.question_id)
-        question = session.exec(statement).first()
+        question = questions_by_id.get(aq.question_id)
 
         if question:
             attempted_questions_data.append({
@@ -178,7 +183,7 @@ async def analyze_weaknesses(
 
     # Step 6: Call LLM with fallback orchestration
     if llm_orchestrator is None:
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
     try:
         logger.info(
@@ -399,9 +404,8 @@ async def generate_model_answer(
         7. Return ModelAnswer
     """
 
-    # Step 1: Fetch question from database
-    statement = select(Question).where(Question.id == request.question_id)
-    question = session.exec(statement).first()
+    # Step 1: Fetch question from database (by primary key)
+    question = session.get(Question, request.question_id)
 
     if not question:
         raise QuestionNotFoundError(f"Question {request.question_id} not found")
@@ -411,10 +415,9 @@ async def generate_model_answer(
     marks_awarded = None
 
     if request.attempted_question_id:
-        statement = select(AttemptedQuestion).where(
-            AttemptedQuestion.id == request.attempted_question_id
+        attempted_question = session.get(
+            AttemptedQuestion, request.attempted_question_id
         )
-        attempted_question = session.exec(statement).first()
 
         if not attempted_question:
             raise AttemptedQuestionNotFoundError(
@@ -435,7 +438,7 @@ async def generate_model_answer(
 
     # Step 4: Call LLM with fallback orchestration
     if llm_orchestrator is None:
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
     try:
         logger.info(
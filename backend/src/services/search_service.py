@@ -402,26 +402,26 @@ class SearchService:
             >>> filters['years']
             [2023, 2022, 2021, 2020]
         """
-        stmt = select(Question)
-
-        # Filter by subject if provided
+        # Resolve subject filter once, then dedupe in SQL: DISTINCT on a
+        # single column returns the handful of distinct values instead of
+        # pulling every Question row just to set-comprehend over it
+        subject_id = None
         if subject_code:
             stmt_subject = select(Subject).where(Subject.code == subject_code)
             subject = self.db.exec(stmt_subject).first()
             if subject:
-                stmt = stmt.where(Question.subject_id == subject.id)
-
-        questions = self.db.exec(stmt).all()
+                subject_id = subject.id
 
-        # Extract unique values
-        years = sorted(set(q.year for q in questions if q.year), reverse=True)
-        sessions = sorted(set(q.session for q in questions if q.session))
-        paper_numbers = sorted(set(q.paper_number for q in questions if q.paper_number))
-        difficulties = sorted(set(q.difficulty for q in questions if q.difficulty))
+        def distinct_values(column, descending: bool = False) -> list:
+            stmt = select(column).where(column.is_not(None)).distinct()
+            if subject_id:
+                stmt = stmt.where(Question.subject_id == subject_id)
+            stmt = stmt.order_by(column.desc() if descending else column)
+            return list(self.db.exec(stmt).all())
 
         return {
-            "years": years,
-            "sessions": sessions,
-            "paper_numbers": paper_numbers,
-            "difficulties": difficulties,
+            "years": distinct_values(Question.year, descending=True),
+            "sessions": distinct_values(Question.session),
+            "paper_numbers": distinct_values(Question.paper_number),
+            "difficulties": distinct_values(Question.difficulty),
         }
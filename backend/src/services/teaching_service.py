@@ -31,7 +31,7 @@ from src.schemas.teaching_schemas import (
     Misconception,
     PracticeProblem,
 )
-from src.ai_integration.llm_fallback import LLMFallbackOrchestrator
+from src.ai_integration.llm_fallback import LLMFallbackOrchestrator, get_llm_orchestrator
 from src.ai_integration.prompt_templates.teacher_prompts import (
     TeacherPrompts,
     create_explanation_prompt,
@@ -155,7 +155,7 @@ async def explain_concept(
 
     # Step 5: Call LLM with fallback orchestration
     if llm_orchestrator is None:
-        llm_orchestrator = LLMFallbackOrchestrator()
+        llm_orchestrator = get_llm_orchestrator()
 
     try:
         logger.info(
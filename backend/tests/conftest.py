@@ -9,9 +9,16 @@ Constitutional Requirements:
 - Multi-tenant isolation tested rigorously
 """
 
+import os
+
+# bcrypt work factor 4 under test (production default is 12): must be
+# set before src.config is imported below, since settings are read at
+# import time
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -19,13 +26,20 @@ from src.database import get_session
 from src.main import app
 
 
-@pytest.fixture(name="engine", scope="function")
+@pytest.fixture(name="engine", scope="session", autouse=True)
 def engine_fixture():
     """
-    Create in-memory SQLite engine for testing
+    Create in-memory SQLite engine shared across the test session
 
     Uses StaticPool to maintain single connection across threads.
-    Database is recreated for each test (clean slate).
+    Tables are created once; per-test isolation comes from the
+    transaction rollback in session_fixture, so the suite avoids
+    paying CREATE TABLE/DROP TABLE DDL for every test.
+
+    autouse=True so the one-time create_all runs before any test body:
+    a few tests re-import models under a second module path (src on
+    pythonpath), which leaves duplicate index entries in the shared
+    metadata and would break a later lazy create_all.
 
     Yields:
         Engine: SQLAlchemy engine with test database
@@ -37,8 +51,26 @@ def engine_fixture():
         poolclass=StaticPool,  # Single connection for in-memory DB
     )
 
-    # Create all tables with checkfirst=True to avoid "already exists" errors
-    # This is needed because some tests reimport models multiple times
+    # pysqlite never emits BEGIN itself, which silently breaks the
+    # SAVEPOINT-based rollback isolation below - use the documented
+    # SQLAlchemy recipe to take over transaction control
+    @event.listens_for(engine, "connect")
+    def _sqlite_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Test data is ephemeral: skip fsync and keep journal/temp
+        # structures in memory so remaining commit() calls cost nothing
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _sqlite_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Create all tables once with checkfirst=True to avoid "already exists"
+    # errors when some tests reimport models
     try:
         SQLModel.metadata.create_all(engine, checkfirst=True)
     except Exception:
@@ -48,21 +80,18 @@ def engine_fixture():
 
     yield engine
 
-    # Clean up after test
-    try:
-        SQLModel.metadata.drop_all(engine)
-    except Exception:
-        pass  # Ignore drop errors
     engine.dispose()
 
 
 @pytest.fixture(name="session")
 def session_fixture(engine):
     """
-    Create test database session
+    Create test database session wrapped in a rolled-back transaction
 
-    Each test gets a fresh session with empty database.
-    Rollback happens automatically after test completes.
+    Each test runs inside an outer transaction on one connection;
+    commits inside the test (or the app under test) become SAVEPOINTs,
+    and the outer transaction is rolled back at teardown. Every test
+    therefore still sees a clean database, without per-test DDL.
 
     Args:
         engine: Test database engine (from engine_fixture)
@@ -70,26 +99,32 @@ def session_fixture(engine):
     Yields:
         Session: SQLModel session for test
     """
-    with Session(engine) as session:
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
         yield session
 
+    transaction.rollback()
+    connection.close()
+
 
 @pytest.fixture(name="db_session")
-def db_session_fixture(engine):
+def db_session_fixture(session):
     """
     Alias for session fixture (for integration tests compatibility)
 
-    Each test gets a fresh session with empty database.
-    Rollback happens automatically after test completes.
+    Yields the same transactional session as session_fixture so tests
+    that populate data via db_session and query it through the API
+    client share one transaction.
 
     Args:
-        engine: Test database engine (from engine_fixture)
+        session: Test database session (from session_fixture)
 
     Yields:
         Session: SQLModel session for test
     """
-    with Session(engine) as session:
-        yield session
+    yield session
 
 
 @pytest.fixture(name="client")
@@ -123,6 +158,81 @@ def client_fixture(session: Session):
     app.dependency_overrides.clear()
 
 
+# Password hashing memoization
+#
+# bcrypt at work factor 12 costs ~300ms per call and dominates the
+# student service tests' runtime. Hash each distinct plaintext once per
+# pytest session and reuse the (real) hash afterwards; tests that
+# verify salt uniqueness opt out with @pytest.mark.no_bcrypt_cache.
+
+
+def pytest_addoption(parser):
+    """Add --run-slow for opting in to tests marked slow"""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (skipped by default)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow-marked tests unless --run-slow was given"""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_bcrypt_fixture():
+    """Pay bcrypt's one-time C-extension/dlopen cost during session setup
+
+    Otherwise the first test that hashes a password absorbs the lazy
+    initialization (~hundreds of ms) and looks slower than its peers.
+    """
+    import bcrypt
+
+    bcrypt.hashpw(b"warmup", bcrypt.gensalt(rounds=4))
+
+
+@pytest.fixture(name="_password_hash_cache", scope="session")
+def password_hash_cache_fixture():
+    """Install a memoizing wrapper around hash_password for the session"""
+    from src.services import auth_service, student_service
+
+    real_hash_password = auth_service.hash_password
+    cache: dict[str, str] = {}
+    bypass = {"active": False}
+
+    def cached_hash_password(plain_password: str) -> str:
+        if bypass["active"]:
+            return real_hash_password(plain_password)
+        if plain_password not in cache:
+            cache[plain_password] = real_hash_password(plain_password)
+        return cache[plain_password]
+
+    monkeypatch = pytest.MonkeyPatch()
+    # student_service imports the name directly, so patch both bindings
+    monkeypatch.setattr(auth_service, "hash_password", cached_hash_password)
+    monkeypatch.setattr(student_service, "hash_password", cached_hash_password)
+
+    yield bypass
+
+    monkeypatch.undo()
+
+
+@pytest.fixture(autouse=True)
+def bcrypt_cache_fixture(request, _password_hash_cache):
+    """Honor the no_bcrypt_cache marker on individual tests"""
+    marked = request.node.get_closest_marker("no_bcrypt_cache") is not None
+    _password_hash_cache["active"] = marked
+    yield
+    _password_hash_cache["active"] = False
+
+
 # Test data factories
 
 
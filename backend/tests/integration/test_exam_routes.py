@@ -33,8 +33,7 @@ def test_data(db_session):
         syllabus_year="2023-2025",
     )
     db_session.add(subject)
-    db_session.commit()
-    db_session.refresh(subject)
+    db_session.flush()  # populate subject.id; durability is asserted nowhere here
 
     # Create syllabus points
     sp1 = SyllabusPoint(
@@ -49,13 +48,10 @@ def test_data(db_session):
         description="Supply and demand",
         topics="Market equilibrium",
     )
-    db_session.add(sp1)
-    db_session.add(sp2)
-    db_session.commit()
-    db_session.refresh(sp1)
-    db_session.refresh(sp2)
+    db_session.add_all([sp1, sp2])
+    db_session.flush()  # populate syllabus point IDs for question tagging
 
-    # Create 10 test questions with varied difficulty
+    # Create 10 test questions with varied difficulty (batched insert)
     questions = []
     for i in range(1, 11):
         if i <= 3:
@@ -68,21 +64,22 @@ def test_data(db_session):
             difficulty = "hard"
             marks = 12
 
-        q = Question(
-            subject_id=subject.id,
-            question_text=f"Test question {i}",
-            max_marks=marks,
-            difficulty=difficulty,
-            source_paper=f"9708_s22_qp_22",
-            paper_number=22,
-            question_number=i,
-            year=2022,
-            session="MAY_JUNE",
-            syllabus_point_ids=[str(sp1.id) if i % 2 == 0 else str(sp2.id)],
+        questions.append(
+            Question(
+                subject_id=subject.id,
+                question_text=f"Test question {i}",
+                max_marks=marks,
+                difficulty=difficulty,
+                source_paper=f"9708_s22_qp_22",
+                paper_number=22,
+                question_number=i,
+                year=2022,
+                session="MAY_JUNE",
+                syllabus_point_ids=[str(sp1.id) if i % 2 == 0 else str(sp2.id)],
+            )
         )
-        db_session.add(q)
-        questions.append(q)
 
+    db_session.add_all(questions)
     db_session.commit()
     return {"subject": subject, "questions": questions, "sp1": sp1, "sp2": sp2}
 
@@ -321,8 +318,7 @@ class TestGetExam:
             status="PENDING",
         )
         db_session.add(exam)
-        db_session.commit()
-        db_session.refresh(exam)
+        db_session.flush()  # populate exam.id without a refresh round-trip
 
         response = client.get(f"/api/exams/{exam.id}")
 
@@ -357,8 +353,7 @@ class TestGetExamQuestions:
             status="PENDING",
         )
         db_session.add(exam)
-        db_session.commit()
-        db_session.refresh(exam)
+        db_session.flush()  # populate exam.id without a refresh round-trip
 
         response = client.get(f"/api/exams/{exam.id}/questions")
 
@@ -384,8 +379,7 @@ class TestGetExamQuestions:
             status="PENDING",
         )
         db_session.add(exam)
-        db_session.commit()
-        db_session.refresh(exam)
+        db_session.flush()  # populate exam.id without a refresh round-trip
 
         response = client.get(f"/api/exams/{exam.id}/questions")
 
@@ -414,8 +408,7 @@ class TestGetExamStatistics:
             status="PENDING",
         )
         db_session.add(exam)
-        db_session.commit()
-        db_session.refresh(exam)
+        db_session.flush()  # populate exam.id without a refresh round-trip
 
         response = client.get(f"/api/exams/{exam.id}/statistics")
 
@@ -452,8 +445,7 @@ class TestUpdateExamStatus:
             status="PENDING",
         )
         db_session.add(exam)
-        db_session.commit()
-        db_session.refresh(exam)
+        db_session.flush()  # populate exam.id without a refresh round-trip
 
         response = client.patch(
             f"/api/exams/{exam.id}/status", json={"status": "IN_PROGRESS"}
@@ -474,8 +466,7 @@ class TestUpdateExamStatus:
             status="IN_PROGRESS",
         )
         db_session.add(exam)
-        db_session.commit()
-        db_session.refresh(exam)
+        db_session.flush()  # populate exam.id without a refresh round-trip
 
         response = client.patch(
             f"/api/exams/{exam.id}/status", json={"status": "COMPLETED"}
@@ -496,8 +487,7 @@ class TestUpdateExamStatus:
             status="PENDING",
         )
         db_session.add(exam)
-        db_session.commit()
-        db_session.refresh(exam)
+        db_session.flush()  # populate exam.id without a refresh round-trip
 
         response = client.patch(
             f"/api/exams/{exam.id}/status", json={"status": "INVALID_STATUS"}
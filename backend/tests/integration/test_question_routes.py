@@ -28,8 +28,7 @@ def test_data(db_session):
         syllabus_year="2023-2025",
     )
     db_session.add(subject)
-    db_session.commit()
-    db_session.refresh(subject)
+    db_session.flush()  # populate subject.id; durability is asserted nowhere here
 
     # Create syllabus points
     sp1 = SyllabusPoint(
@@ -44,18 +43,15 @@ def test_data(db_session):
         description="Supply and demand",
         topics="Market equilibrium",
     )
-    db_session.add(sp1)
-    db_session.add(sp2)
-    db_session.commit()
-    db_session.refresh(sp1)
-    db_session.refresh(sp2)
+    db_session.add_all([sp1, sp2])
+    db_session.flush()  # populate syllabus point IDs for question tagging
 
-    # Create diverse test questions
+    # Create diverse test questions (batched into one add_all)
     questions = []
 
     # Easy questions (2022)
-    for i in range(1, 4):
-        q = Question(
+    questions += [
+        Question(
             subject_id=subject.id,
             question_text=f"What is opportunity cost? Example {i}",
             max_marks=4,
@@ -67,12 +63,12 @@ def test_data(db_session):
             session="MAY_JUNE",
             syllabus_point_ids=[str(sp1.id)],
         )
-        db_session.add(q)
-        questions.append(q)
+        for i in range(1, 4)
+    ]
 
     # Medium questions (2021)
-    for i in range(4, 7):
-        q = Question(
+    questions += [
+        Question(
             subject_id=subject.id,
             question_text=f"Explain supply and demand equilibrium. Question {i}",
             max_marks=8,
@@ -84,12 +80,12 @@ def test_data(db_session):
             session="OCT_NOV",
             syllabus_point_ids=[str(sp2.id)],
         )
-        db_session.add(q)
-        questions.append(q)
+        for i in range(4, 7)
+    ]
 
     # Hard questions (2020)
-    for i in range(7, 10):
-        q = Question(
+    questions += [
+        Question(
             subject_id=subject.id,
             question_text=f"Discuss market failure and government intervention. Part {i}",
             max_marks=12,
@@ -101,9 +97,10 @@ def test_data(db_session):
             session="MAY_JUNE",
             syllabus_point_ids=[str(sp1.id), str(sp2.id)],
         )
-        db_session.add(q)
-        questions.append(q)
+        for i in range(7, 10)
+    ]
 
+    db_session.add_all(questions)
     db_session.commit()
     return {"subject": subject, "questions": questions, "sp1": sp1, "sp2": sp2}
 
@@ -28,31 +28,26 @@ def test_data(db_session):
         syllabus_year="2023-2025",
     )
     db_session.add(subject)
-    db_session.commit()
-    db_session.refresh(subject)
+    db_session.flush()  # populate subject.id without ending the transaction
 
-    # Create 10 syllabus points
-    syllabus_points = []
-    for i in range(1, 11):
-        sp = SyllabusPoint(
+    # Create 10 syllabus points (batched: one add_all instead of
+    # row-wise add calls)
+    syllabus_points = [
+        SyllabusPoint(
             subject_id=subject.id,
             code=f"9708.{i}.1",
             description=f"Topic {i}",
             topics=f"Subtopic {i}",
         )
-        db_session.add(sp)
-        syllabus_points.append(sp)
-
-    db_session.commit()
-    for sp in syllabus_points:
-        db_session.refresh(sp)
-
-    # Create questions that tag SOME syllabus points (not all)
-    questions = []
-
-    # Tag first 5 syllabus points with questions
-    for i in range(5):
-        q = Question(
+        for i in range(1, 11)
+    ]
+    db_session.add_all(syllabus_points)
+    db_session.flush()  # populate syllabus point IDs for question tagging
+
+    # Create questions that tag SOME syllabus points (not all):
+    # first 5 syllabus points get one question each
+    questions = [
+        Question(
             subject_id=subject.id,
             question_text=f"Question about topic {i+1}",
             max_marks=8,
@@ -64,24 +59,25 @@ def test_data(db_session):
             session="MAY_JUNE",
             syllabus_point_ids=[str(syllabus_points[i].id)],
         )
-        db_session.add(q)
-        questions.append(q)
-
-    # Create one question tagging multiple syllabus points
-    q_multi = Question(
-        subject_id=subject.id,
-        question_text="Question covering multiple topics",
-        max_marks=12,
-        difficulty="hard",
-        source_paper="9708_s22_qp_22",
-        paper_number=22,
-        question_number=6,
-        year=2022,
-        session="MAY_JUNE",
-        syllabus_point_ids=[str(syllabus_points[0].id), str(syllabus_points[1].id)],
+        for i in range(5)
+    ]
+
+    # Plus one question tagging multiple syllabus points
+    questions.append(
+        Question(
+            subject_id=subject.id,
+            question_text="Question covering multiple topics",
+            max_marks=12,
+            difficulty="hard",
+            source_paper="9708_s22_qp_22",
+            paper_number=22,
+            question_number=6,
+            year=2022,
+            session="MAY_JUNE",
+            syllabus_point_ids=[str(syllabus_points[0].id), str(syllabus_points[1].id)],
+        )
     )
-    db_session.add(q_multi)
-    questions.append(q_multi)
+    db_session.add_all(questions)
 
     db_session.commit()
 
@@ -234,17 +230,19 @@ class TestSyllabusCoverage:
             syllabus_year="2023-2025",
         )
         db_session.add(subject)
-        db_session.commit()
-        db_session.refresh(subject)
-
-        # Add syllabus points
-        for i in range(1, 4):
-            sp = SyllabusPoint(
-                subject_id=subject.id,
-                code=f"9709.{i}.1",
-                description=f"Math Topic {i}",
-            )
-            db_session.add(sp)
+        db_session.flush()  # populate subject.id without a refresh round-trip
+
+        # Add syllabus points (batched)
+        db_session.add_all(
+            [
+                SyllabusPoint(
+                    subject_id=subject.id,
+                    code=f"9709.{i}.1",
+                    description=f"Math Topic {i}",
+                )
+                for i in range(1, 4)
+            ]
+        )
         db_session.commit()
 
         response = client.get("/api/syllabus/coverage/9709")
@@ -267,38 +265,38 @@ class TestSyllabusCoverage:
             syllabus_year="2023-2025",
         )
         db_session.add(subject)
-        db_session.commit()
-        db_session.refresh(subject)
+        db_session.flush()  # populate subject.id without a refresh round-trip
 
-        # Add syllabus points
-        syllabus_points = []
-        for i in range(1, 4):
-            sp = SyllabusPoint(
+        # Add syllabus points (batched)
+        syllabus_points = [
+            SyllabusPoint(
                 subject_id=subject.id,
                 code=f"9706.{i}.1",
                 description=f"Accounting Topic {i}",
             )
-            db_session.add(sp)
-            syllabus_points.append(sp)
-        db_session.commit()
-        for sp in syllabus_points:
-            db_session.refresh(sp)
-
-        # Add questions for ALL syllabus points
-        for i, sp in enumerate(syllabus_points):
-            q = Question(
-                subject_id=subject.id,
-                question_text=f"Accounting question {i+1}",
-                max_marks=8,
-                difficulty="medium",
-                source_paper="9706_s22_qp_22",
-                paper_number=22,
-                question_number=i + 1,
-                year=2022,
-                session="MAY_JUNE",
-                syllabus_point_ids=[str(sp.id)],
-            )
-            db_session.add(q)
+            for i in range(1, 4)
+        ]
+        db_session.add_all(syllabus_points)
+        db_session.flush()  # populate syllabus point IDs for tagging
+
+        # Add questions for ALL syllabus points (batched)
+        db_session.add_all(
+            [
+                Question(
+                    subject_id=subject.id,
+                    question_text=f"Accounting question {i+1}",
+                    max_marks=8,
+                    difficulty="medium",
+                    source_paper="9706_s22_qp_22",
+                    paper_number=22,
+                    question_number=i + 1,
+                    year=2022,
+                    session="MAY_JUNE",
+                    syllabus_point_ids=[str(sp.id)],
+                )
+                for i, sp in enumerate(syllabus_points)
+            ]
+        )
         db_session.commit()
 
         response = client.get("/api/syllabus/coverage/9706")
@@ -0,0 +1,93 @@
+"""
+Shared Fixtures for Unit Tests
+
+Module-scoped Subject/SyllabusPoint sample data used across the
+syllabus-tagging test classes. SQLModel construction runs Pydantic
+validation plus uuid4() per instance; building these once per module
+instead of per test amortizes that cost across the matrix.
+
+Only immutable fixtures live here - tests that mutate state (e.g.
+question tagging) keep function-scoped fixtures in their own module.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from src.models.subject import Subject
+from src.models.syllabus_point import SyllabusPoint
+
+
+class _DBStub:
+    """Hand-rolled Session stand-in with only the methods the routes use
+
+    A bare MagicMock wires up its dynamic attribute machinery on every
+    construction; this slotted stub is built once per session and reset
+    per test, so each test pays a few reset_mock() calls instead.
+    """
+
+    __slots__ = ("exec", "add", "commit", "refresh", "delete")
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, MagicMock())
+
+    def reset(self):
+        """Clear call records and configured returns between tests"""
+        for name in self.__slots__:
+            getattr(self, name).reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def _db_stub():
+    """Construct the shared database stub once per session"""
+    return _DBStub()
+
+
+@pytest.fixture(name="mock_db")
+def mock_db_fixture(_db_stub):
+    """Mock database session (reset before each test)"""
+    _db_stub.reset()
+    return _db_stub
+
+
+@pytest.fixture(scope="session")
+def fake_uuids():
+    """Pool of preformatted UUID strings (one urandom syscall batch)
+
+    Tests that only need opaque unique ids pull slices of this tuple
+    instead of paying an os.urandom(16) syscall per str(uuid4()) call.
+    """
+    return tuple(str(uuid4()) for _ in range(32))
+
+
+@pytest.fixture(scope="module")
+def sample_subject():
+    """Create sample subject (shared read-only across a test module)"""
+    return Subject(
+        id=uuid4(),
+        code="9708",
+        name="Economics",
+        level="A",
+        syllabus_year="2023-2025",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_syllabus_points(sample_subject):
+    """Create 5 syllabus points (shared read-only across a test module)
+
+    Coverage tests rely on the exact layout: 5 points with codes
+    9708.1.1 through 9708.1.5. Tests needing fewer slice the list.
+    """
+    # Batch the id draws so the comprehension below is pure construction
+    ids = [uuid4() for _ in range(5)]
+    return [
+        SyllabusPoint(
+            id=ids[i - 1],
+            subject_id=sample_subject.id,
+            code=f"9708.1.{i}",
+            description=f"Topic {i}",
+        )
+        for i in range(1, 6)
+    ]
@@ -18,6 +18,8 @@ Constitutional Requirement:
 - >80% test coverage (Principle VII)
 """
 
+import re
+
 import pytest
 
 from src.question_extractors.cambridge_parser import (
@@ -28,13 +30,17 @@ from src.question_extractors.cambridge_parser import (
     Session,
 )
 
+# Precompiled once: pytest.raises(match=...) would otherwise recompile
+# the pattern for every parametrized case
+_FORMAT_ERROR_RE = re.compile("Cambridge International format")
+
 
 class TestCambridgeFilenameParser:
     """Test suite for Cambridge International filename parsing"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self) -> CambridgeFilenameParser:
-        """Create parser instance for tests"""
+        """Create parser instance once per module (stateless, regex is class-level)"""
         return CambridgeFilenameParser()
 
     # ========================================================================
@@ -197,27 +203,29 @@ class TestCambridgeFilenameParser:
         assert invalid_filename in str(exc_info.value)
         assert "Cambridge International format" in str(exc_info.value)
 
-    def test_parse_invalid_formats_comprehensive(self, parser: CambridgeFilenameParser):
+    @pytest.mark.parametrize(
+        "invalid_filename",
+        [
+            pytest.param("economics_paper_2022.pdf", id="wrong_format_entirely"),
+            pytest.param("9708_s22.pdf", id="missing_components"),
+            pytest.param("9708_s22_qp.pdf", id="missing_paper_number"),
+            pytest.param("708_s22_qp_31.pdf", id="wrong_subject_code_length"),
+            pytest.param("9708_x22_qp_31.pdf", id="invalid_session_code"),
+            pytest.param("9708_s22_xx_31.pdf", id="invalid_paper_type"),
+            pytest.param("9708_s22_qp_31.doc", id="wrong_extension"),
+        ],
+    )
+    def test_parse_invalid_formats_comprehensive(
+        self, parser: CambridgeFilenameParser, invalid_filename: str
+    ):
         """
         T026 (additional): Test various invalid formats
 
-        Tests robustness with different types of invalid filenames
+        Parametrized so a failure names the offending filename and the
+        remaining cases still run (also distributable via pytest-xdist)
         """
-        invalid_filenames = [
-            "economics_paper_2022.pdf",  # Wrong format entirely
-            "9708_s22.pdf",  # Missing components
-            "9708_s22_qp.pdf",  # Missing paper number
-            "708_s22_qp_31.pdf",  # Wrong subject code length
-            "9708_x22_qp_31.pdf",  # Invalid session code
-            "9708_s22_xx_31.pdf",  # Invalid paper type
-            "9708_s22_qp_31.doc",  # Wrong extension
-        ]
-
-        for invalid_filename in invalid_filenames:
-            with pytest.raises(
-                InvalidFilenameFormatError, match="Cambridge International format"
-            ):
-                parser.parse(invalid_filename)
+        with pytest.raises(InvalidFilenameFormatError, match=_FORMAT_ERROR_RE):
+            parser.parse(invalid_filename)
 
     # ========================================================================
     # Additional Tests: Edge Cases & Robustness
@@ -17,7 +17,17 @@ Constitutional Requirement:
 """
 
 import pytest
-from uuid import uuid4
+from itertools import count
+from uuid import UUID
+
+# Deterministic UUID pool for fixtures: avoids an OS entropy draw per
+# _fake_uuid() call and makes test failures reproducible
+_id_counter = count(1)
+
+
+def _fake_uuid() -> UUID:
+    """Return the next deterministic UUID from the module pool"""
+    return UUID(int=next(_id_counter), version=4)
 
 from src.models.exam import Exam
 from src.models.question import Question
@@ -28,6 +38,29 @@ from src.services.exam_generation_service import (
 )
 
 
+class _ScalarsResult:
+    """Lightweight stand-in for a session.exec() result
+
+    The exam queries only call scalars() and iterate the rows; a plain
+    slotted object avoids MagicMock's dynamic attribute machinery and
+    the assign-__iter__-on-the-instance lambda gotcha.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+
+    def scalars(self):
+        return self
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def all(self):
+        return list(self._rows)
+
+
 class TestExamGenerationBasic:
     """Test basic exam generation functionality"""
 
@@ -44,10 +77,10 @@ class TestExamGenerationBasic:
     @pytest.fixture
     def sample_questions(self):
         """Create sample questions for testing"""
-        subject_id = uuid4()
+        subject_id = _fake_uuid()
         return [
             Question(
-                id=uuid4(),
+                id=_fake_uuid(),
                 subject_id=subject_id,
                 question_text=f"Question {i}",
                 max_marks=8,
@@ -62,16 +95,12 @@ class TestExamGenerationBasic:
             for i in range(1, 11)  # 10 questions: 3 easy, 4 medium, 3 hard
         ]
 
-    def test_generate_exam_validates_exam_type(self, service, mock_db, mocker):
+    def test_generate_exam_validates_exam_type(self, service, mock_db):
         """Test exam type validation"""
-        subject_id = uuid4()
+        subject_id = _fake_uuid()
 
         # Mock DB to return empty results
-        mocker.patch.object(
-            mock_db,
-            "exec",
-            return_value=mocker.MagicMock(all=lambda: []),
-        )
+        mock_db.exec.return_value = _ScalarsResult()
 
         with pytest.raises(ExamGenerationError, match="Invalid exam type"):
             service.generate_exam(
@@ -79,16 +108,12 @@ class TestExamGenerationBasic:
                 exam_type="INVALID_TYPE",
             )
 
-    def test_generate_exam_no_questions_available(self, service, mock_db, mocker):
+    def test_generate_exam_no_questions_available(self, service, mock_db):
         """Test error when no questions available"""
-        subject_id = uuid4()
+        subject_id = _fake_uuid()
 
         # Mock DB to return empty question list
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        exec_mock = mocker.MagicMock()
-        exec_mock.scalars.return_value = scalars_mock
-        mock_db.exec.return_value = exec_mock
+        mock_db.exec.return_value = _ScalarsResult()
 
         with pytest.raises(ExamGenerationError, match="No questions available"):
             service.generate_exam(
@@ -97,21 +122,13 @@ class TestExamGenerationBasic:
                 question_count=5,
             )
 
-    def test_generate_exam_creates_exam_entity(self, service, mock_db, mocker, sample_questions):
+    def test_generate_exam_creates_exam_entity(self, service, mock_db, sample_questions):
         """Test exam entity creation"""
         subject_id = sample_questions[0].subject_id
 
-        # Mock DB exec to return sample questions
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter(sample_questions)
-        exec_mock = mocker.MagicMock()
-        exec_mock.scalars.return_value = scalars_mock
-
-        # Mock add, commit, refresh
-        mock_db.exec.return_value = exec_mock
-        mock_db.add = mocker.MagicMock()
-        mock_db.commit = mocker.MagicMock()
-        mock_db.refresh = mocker.MagicMock()
+        # Mock DB exec to return sample questions (add/commit/refresh
+        # are already MagicMock attributes of mock_db)
+        mock_db.exec.return_value = _ScalarsResult(sample_questions)
 
         exam = service.generate_exam(
             subject_id=subject_id,
@@ -140,10 +157,10 @@ class TestRandomStrategy:
     @pytest.fixture
     def sample_questions(self):
         """Create 20 sample questions"""
-        subject_id = uuid4()
+        subject_id = _fake_uuid()
         return [
             Question(
-                id=uuid4(),
+                id=_fake_uuid(),
                 subject_id=subject_id,
                 question_text=f"Question {i}",
                 max_marks=8,
@@ -203,14 +220,14 @@ class TestBalancedStrategy:
     @pytest.fixture
     def sample_questions(self):
         """Create questions with varied difficulty"""
-        subject_id = uuid4()
+        subject_id = _fake_uuid()
         questions = []
 
         # 10 easy questions
         for i in range(1, 11):
             questions.append(
                 Question(
-                    id=uuid4(),
+                    id=_fake_uuid(),
                     subject_id=subject_id,
                     question_text=f"Easy Q{i}",
                     max_marks=4,
@@ -227,7 +244,7 @@ class TestBalancedStrategy:
         for i in range(11, 21):
             questions.append(
                 Question(
-                    id=uuid4(),
+                    id=_fake_uuid(),
                     subject_id=subject_id,
                     question_text=f"Medium Q{i}",
                     max_marks=8,
@@ -244,7 +261,7 @@ class TestBalancedStrategy:
         for i in range(21, 31):
             questions.append(
                 Question(
-                    id=uuid4(),
+                    id=_fake_uuid(),
                     subject_id=subject_id,
                     question_text=f"Hard Q{i}",
                     max_marks=12,
@@ -351,7 +368,7 @@ class TestSyllabusCoverageStrategy:
     @pytest.fixture
     def sample_questions(self):
         """Create questions with diverse syllabus points"""
-        subject_id = uuid4()
+        subject_id = _fake_uuid()
         questions = []
 
         # 3 questions per topic (5 topics)
@@ -359,7 +376,7 @@ class TestSyllabusCoverageStrategy:
             for q_idx in range(1, 4):
                 questions.append(
                     Question(
-                        id=uuid4(),
+                        id=_fake_uuid(),
                         subject_id=subject_id,
                         question_text=f"Topic {topic_idx} Q{q_idx}",
                         max_marks=8,
@@ -412,7 +429,7 @@ class TestSyllabusCoverageStrategy:
         subject_id = sample_questions[0].subject_id
         untagged = [
             Question(
-                id=uuid4(),
+                id=_fake_uuid(),
                 subject_id=subject_id,
                 question_text="Untagged Q",
                 max_marks=8,
@@ -450,12 +467,12 @@ class TestExamMetadata:
         """Create service"""
         return ExamGenerationService(mock_db)
 
-    def test_total_marks_calculation(self, service, mocker):
+    def test_total_marks_calculation(self, service):
         """Test total marks calculation"""
         questions = [
             Question(
-                id=uuid4(),
-                subject_id=uuid4(),
+                id=_fake_uuid(),
+                subject_id=_fake_uuid(),
                 question_text=f"Q{i}",
                 max_marks=i * 2,  # 2, 4, 6, 8, 10
                 source_paper="9708_s22_qp_22",
@@ -469,14 +486,7 @@ class TestExamMetadata:
         ]
 
         # Mock DB
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter(questions)
-        exec_mock = mocker.MagicMock()
-        exec_mock.scalars.return_value = scalars_mock
-        service.db.exec.return_value = exec_mock
-        service.db.add = mocker.MagicMock()
-        service.db.commit = mocker.MagicMock()
-        service.db.refresh = mocker.MagicMock()
+        service.db.exec.return_value = _ScalarsResult(questions)
 
         exam = service.generate_exam(
             subject_id=questions[0].subject_id,
@@ -487,12 +497,12 @@ class TestExamMetadata:
         # Total: 2 + 4 + 6 + 8 + 10 = 30
         assert exam.total_marks == sum(q.max_marks for q in questions)
 
-    def test_duration_auto_calculation(self, service, mocker):
+    def test_duration_auto_calculation(self, service):
         """Test duration auto-calculation (2 minutes per mark)"""
         questions = [
             Question(
-                id=uuid4(),
-                subject_id=uuid4(),
+                id=_fake_uuid(),
+                subject_id=_fake_uuid(),
                 question_text=f"Q{i}",
                 max_marks=10,
                 source_paper="9708_s22_qp_22",
@@ -505,14 +515,7 @@ class TestExamMetadata:
             for i in range(1, 6)
         ]
 
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter(questions)
-        exec_mock = mocker.MagicMock()
-        exec_mock.scalars.return_value = scalars_mock
-        service.db.exec.return_value = exec_mock
-        service.db.add = mocker.MagicMock()
-        service.db.commit = mocker.MagicMock()
-        service.db.refresh = mocker.MagicMock()
+        service.db.exec.return_value = _ScalarsResult(questions)
 
         exam = service.generate_exam(
             subject_id=questions[0].subject_id,
@@ -524,12 +527,12 @@ class TestExamMetadata:
         # Total marks: 50, Duration: 50 * 2 = 100 minutes
         assert exam.duration == 100
 
-    def test_duration_minimum_30_minutes(self, service, mocker):
+    def test_duration_minimum_30_minutes(self, service):
         """Test duration minimum is 30 minutes"""
         questions = [
             Question(
-                id=uuid4(),
-                subject_id=uuid4(),
+                id=_fake_uuid(),
+                subject_id=_fake_uuid(),
                 question_text="Q1",
                 max_marks=5,  # Only 5 marks total
                 source_paper="9708_s22_qp_22",
@@ -541,14 +544,7 @@ class TestExamMetadata:
             )
         ]
 
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter(questions)
-        exec_mock = mocker.MagicMock()
-        exec_mock.scalars.return_value = scalars_mock
-        service.db.exec.return_value = exec_mock
-        service.db.add = mocker.MagicMock()
-        service.db.commit = mocker.MagicMock()
-        service.db.refresh = mocker.MagicMock()
+        service.db.exec.return_value = _ScalarsResult(questions)
 
         exam = service.generate_exam(
             subject_id=questions[0].subject_id,
@@ -576,13 +572,13 @@ class TestExamStatistics:
 
     def test_get_exam_statistics(self, service, mocker):
         """Test exam statistics calculation"""
-        exam_id = uuid4()
+        exam_id = _fake_uuid()
 
         # Create exam with questions
         questions = [
             Question(
-                id=uuid4(),
-                subject_id=uuid4(),
+                id=_fake_uuid(),
+                subject_id=_fake_uuid(),
                 question_text="Easy Q",
                 max_marks=4,
                 source_paper="9708_s22_qp_22",
@@ -593,8 +589,8 @@ class TestExamStatistics:
                 difficulty="easy",
             ),
             Question(
-                id=uuid4(),
-                subject_id=uuid4(),
+                id=_fake_uuid(),
+                subject_id=_fake_uuid(),
                 question_text="Medium Q1",
                 max_marks=8,
                 source_paper="9708_s22_qp_22",
@@ -605,8 +601,8 @@ class TestExamStatistics:
                 difficulty="medium",
             ),
             Question(
-                id=uuid4(),
-                subject_id=uuid4(),
+                id=_fake_uuid(),
+                subject_id=_fake_uuid(),
                 question_text="Medium Q2",
                 max_marks=8,
                 source_paper="9708_s22_qp_22",
@@ -617,8 +613,8 @@ class TestExamStatistics:
                 difficulty="medium",
             ),
             Question(
-                id=uuid4(),
-                subject_id=uuid4(),
+                id=_fake_uuid(),
+                subject_id=_fake_uuid(),
                 question_text="Hard Q",
                 max_marks=12,
                 source_paper="9708_s22_qp_22",
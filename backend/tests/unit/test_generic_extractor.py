@@ -342,9 +342,13 @@ class TestGenericExtractor:
 
 # ========================================================================
 # Integration Tests (require actual PDFs and database)
+#
+# Marked slow: they open a live database connection and parse real PDFs,
+# so they are skipped in the default run (opt in with --run-slow).
 # ========================================================================
 
 
+@pytest.mark.slow
 def test_extract_questions_from_economics_paper_2():
     """
     T035: Integration test - Extract from real Economics Paper 2 PDF (Data Response)
@@ -409,6 +413,7 @@ def test_extract_questions_from_economics_paper_2():
             assert question["max_marks"] <= 30
 
 
+@pytest.mark.slow
 def test_extract_multi_page_question():
     """
     T037: Integration test - Handle multi-page questions
@@ -447,6 +452,7 @@ def test_extract_multi_page_question():
         assert len(questions) > 0, "No questions extracted from multi-page PDF"
 
 
+@pytest.mark.slow
 def test_extract_question_with_table():
     """
     T038: Integration test - Handle questions with data tables
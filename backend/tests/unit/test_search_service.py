@@ -18,13 +18,43 @@ Constitutional Requirement:
 
 import pytest
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID
 
 from src.models.mark_scheme import MarkScheme
 from src.models.question import Question
 from src.models.subject import Subject
 from src.services.search_service import SearchService
 
+# Fixed IDs: these tests never compare identifiers, and a constant
+# avoids an os.urandom syscall per uuid4() call
+FIXED_SUBJECT_ID = UUID("00000000-0000-4000-8000-000000000001")
+FIXED_MARK_SCHEME_ID = UUID("00000000-0000-4000-8000-000000000002")
+
+
+class _ExecResult:
+    """Lightweight stand-in for a session.exec() result
+
+    Much cheaper to construct than a MagicMock and enough for these
+    tests, which only ever call one()/all()/first() on the result.
+    """
+
+    __slots__ = ("_one", "_all", "_first")
+
+    def __init__(self, one=None, all=None, first=None):
+        self._one = one
+        self._all = all
+        self._first = first
+
+    def one(self):
+        return self._one
+
+    def all(self):
+        return self._all if self._all is not None else []
+
+    def first(self):
+        return self._first
+
+
 
 class TestSearchServicePagination:
     """Test pagination functionality"""
@@ -39,80 +69,40 @@ class TestSearchServicePagination:
         """Create search service with mocked DB"""
         return SearchService(mock_db)
 
-    def test_pagination_first_page(self, service, mock_db, mocker):
-        """Test first page pagination metadata"""
-        # Mock total count
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 50),  # Total count
-            mocker.MagicMock(all=lambda: []),  # Questions result
-        ])
-
-        results = service.search_questions(page=1, page_size=20)
-
-        assert results["page"] == 1
-        assert results["page_size"] == 20
-        assert results["total"] == 50
-        assert results["total_pages"] == 3  # ceil(50/20)
-        assert results["has_next"] is True
-        assert results["has_prev"] is False
-
-    def test_pagination_middle_page(self, service, mock_db, mocker):
-        """Test middle page pagination"""
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 50),
-            mocker.MagicMock(all=lambda: []),
-        ])
-
-        results = service.search_questions(page=2, page_size=20)
-
-        assert results["page"] == 2
-        assert results["has_next"] is True
-        assert results["has_prev"] is True
-
-    def test_pagination_last_page(self, service, mock_db, mocker):
-        """Test last page pagination"""
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 50),
-            mocker.MagicMock(all=lambda: []),
-        ])
-
-        results = service.search_questions(page=3, page_size=20)
-
-        assert results["page"] == 3
-        assert results["has_next"] is False
-        assert results["has_prev"] is True
-
-    def test_pagination_validates_page_number(self, service, mock_db, mocker):
-        """Test page number validation (negative becomes 1)"""
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 10),
-            mocker.MagicMock(all=lambda: []),
-        ])
-
-        results = service.search_questions(page=-1, page_size=20)
-
-        assert results["page"] == 1  # Negative page becomes 1
-
-    def test_pagination_limits_page_size(self, service, mock_db, mocker):
-        """Test page size validation (max 100)"""
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 10),
-            mocker.MagicMock(all=lambda: []),
-        ])
-
-        results = service.search_questions(page=1, page_size=200)
-
-        assert results["page_size"] == 100  # Capped at 100
+    @pytest.mark.parametrize(
+        "page,page_size,total,expected",
+        [
+            pytest.param(
+                1, 20, 50,
+                {"page": 1, "page_size": 20, "total": 50, "total_pages": 3,
+                 "has_next": True, "has_prev": False},
+                id="first_page",
+            ),
+            pytest.param(
+                2, 20, 50, {"page": 2, "has_next": True, "has_prev": True},
+                id="middle_page",
+            ),
+            pytest.param(
+                3, 20, 50, {"page": 3, "has_next": False, "has_prev": True},
+                id="last_page",
+            ),
+            pytest.param(-1, 20, 10, {"page": 1}, id="negative_page_becomes_1"),
+            pytest.param(1, 200, 10, {"page_size": 100}, id="page_size_capped_at_100"),
+        ],
+    )
+    def test_pagination_metadata(
+        self, service, mock_db, page, page_size, total, expected
+    ):
+        """Pagination metadata is derived from page, page_size and total"""
+        mock_db.exec.side_effect = [
+            _ExecResult(one=total),  # Total count
+            _ExecResult(all=[]),  # Questions result
+        ]
+
+        results = service.search_questions(page=page, page_size=page_size)
+
+        for key, value in expected.items():
+            assert results[key] == value
 
 
 class TestSearchServiceFiltering:
@@ -128,57 +118,46 @@ class TestSearchServiceFiltering:
         """Create search service"""
         return SearchService(mock_db)
 
-    def test_filter_by_subject_code(self, service, mock_db, mocker):
+    def test_filter_by_subject_code(self, service, mock_db):
         """Test filtering by subject code"""
         # Mock subject lookup
         economics_subject = Subject(
-            id=uuid4(),
+            id=FIXED_SUBJECT_ID,
             code="9708",
             name="Economics",
             level="A",
             syllabus_year="2023-2025"
         )
 
-        # Mock DB exec calls
-        subject_scalars = mocker.MagicMock()
-        subject_scalars.first.return_value = economics_subject
-        questions_scalars = mocker.MagicMock()
-        questions_scalars.__iter__ = lambda self: iter([])
-
-        exec_calls = [
-            mocker.MagicMock(first=lambda: economics_subject),  # Subject lookup
-            mocker.MagicMock(one=lambda: 0),  # Total count
-            mocker.MagicMock(all=lambda: []),  # Questions
+        mock_db.exec.side_effect = [
+            _ExecResult(first=economics_subject),  # Subject lookup
+            _ExecResult(one=0),  # Total count
+            _ExecResult(all=[]),  # Questions
         ]
-        mock_db.exec.side_effect = exec_calls
 
         results = service.search_questions(subject_code="9708")
 
         # Verify subject was looked up
         assert mock_db.exec.call_count >= 2
 
-    def test_filter_by_year(self, service, mock_db, mocker):
+    def test_filter_by_year(self, service, mock_db):
         """Test filtering by year"""
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 0),
-            mocker.MagicMock(all=lambda: []),
-        ])
+        mock_db.exec.side_effect = [
+            _ExecResult(one=0),
+            _ExecResult(all=[]),
+        ]
 
         results = service.search_questions(year=2022)
 
         # Should apply year filter in query
         assert results["total"] == 0
 
-    def test_filter_by_marks_range(self, service, mock_db, mocker):
+    def test_filter_by_marks_range(self, service, mock_db):
         """Test filtering by marks range"""
-        scalars_mock = mocker.MagicMock()
-        scalars_mock.__iter__ = lambda self: iter([])
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 0),
-            mocker.MagicMock(all=lambda: []),
-        ])
+        mock_db.exec.side_effect = [
+            _ExecResult(one=0),
+            _ExecResult(all=[]),
+        ]
 
         results = service.search_questions(min_marks=5, max_marks=10)
 
@@ -198,18 +177,34 @@ class TestSearchServiceFullText:
         """Create search service"""
         return SearchService(mock_db)
 
-    def test_search_text_case_insensitive(self, service, mock_db, mocker):
+    def test_search_text_case_insensitive(self, service, mock_db):
         """Test search text is case-insensitive"""
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 0),
-            mocker.MagicMock(all=lambda: []),
-        ])
+        mock_db.exec.side_effect = [
+            _ExecResult(one=0),
+            _ExecResult(all=[]),
+        ]
 
         results = service.search_questions(search_text="OPPORTUNITY COST")
 
         # Should apply ILIKE filter (case-insensitive)
         assert results["total"] == 0
 
+    def test_search_text_builds_ilike_pattern(self, service, mock_db):
+        """The ILIKE pattern is pushed into the SQL statement, not Python"""
+        mock_db.exec.side_effect = [
+            _ExecResult(one=0),
+            _ExecResult(all=[]),
+        ]
+
+        service.search_questions(search_text="OPPORTUNITY COST")
+
+        # Compile the count statement with literal binds: the wrapped
+        # search term must appear in the WHERE clause so the database
+        # (not a post-fetch loop) performs the match
+        count_stmt = mock_db.exec.call_args_list[0][0][0]
+        compiled = str(count_stmt.compile(compile_kwargs={"literal_binds": True}))
+        assert "%OPPORTUNITY COST%" in compiled
+
 
 class TestSearchServiceSorting:
     """Test sorting functionality"""
@@ -224,25 +219,21 @@ class TestSearchServiceSorting:
         """Create search service"""
         return SearchService(mock_db)
 
-    def test_sort_by_year_desc(self, service, mock_db, mocker):
-        """Test sorting by year descending (default)"""
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 0),
-            mocker.MagicMock(all=lambda: []),
-        ])
-
-        results = service.search_questions(sort_by="year", sort_order="desc")
-
-        assert results["total"] == 0
-
-    def test_sort_by_max_marks_asc(self, service, mock_db, mocker):
-        """Test sorting by marks ascending"""
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 0),
-            mocker.MagicMock(all=lambda: []),
-        ])
+    @pytest.mark.parametrize(
+        "sort_by,sort_order",
+        [
+            pytest.param("year", "desc", id="year_desc_default"),
+            pytest.param("max_marks", "asc", id="max_marks_asc"),
+        ],
+    )
+    def test_sort_options(self, service, mock_db, sort_by, sort_order):
+        """Sorting is accepted for each sortable field and direction"""
+        mock_db.exec.side_effect = [
+            _ExecResult(one=0),
+            _ExecResult(all=[]),
+        ]
 
-        results = service.search_questions(sort_by="max_marks", sort_order="asc")
+        results = service.search_questions(sort_by=sort_by, sort_order=sort_order)
 
         assert results["total"] == 0
 
@@ -260,23 +251,23 @@ class TestSearchServiceMarkSchemes:
         """Create search service"""
         return SearchService(mock_db)
 
-    def test_search_mark_schemes_with_text(self, service, mock_db, mocker):
+    def test_search_mark_schemes_with_text(self, service, mock_db):
         """Test searching mark schemes by text"""
-        mocker.patch.object(mock_db, "exec", side_effect=[
-            mocker.MagicMock(one=lambda: 0),
-            mocker.MagicMock(all=lambda: []),
-        ])
+        mock_db.exec.side_effect = [
+            _ExecResult(one=0),
+            _ExecResult(all=[]),
+        ]
 
         results = service.search_mark_schemes(search_text="Level 4")
 
         assert results["total"] == 0
         assert "mark_schemes" in results
 
-    def test_get_mark_scheme_by_source_paper(self, service, mock_db, mocker):
+    def test_get_mark_scheme_by_source_paper(self, service, mock_db):
         """Test retrieving mark scheme by source paper"""
         mock_ms = MarkScheme(
-            id=uuid4(),
-            subject_id=uuid4(),
+            id=FIXED_MARK_SCHEME_ID,
+            subject_id=FIXED_SUBJECT_ID,
             source_paper="9708_s22_ms_22",
             mark_scheme_text="Sample text",
             question_paper_filename="9708_s22_qp_22.pdf",
@@ -285,7 +276,7 @@ class TestSearchServiceMarkSchemes:
             session="MAY_JUNE",
         )
 
-        mocker.patch.object(mock_db, "exec", return_value=mocker.MagicMock(first=lambda: mock_ms))
+        mock_db.exec.return_value = _ExecResult(first=mock_ms)
 
         result = service.get_mark_scheme_by_source_paper("9708_s22_ms_22")
 
@@ -305,40 +296,21 @@ class TestSearchServiceAvailableFilters:
         """Create search service"""
         return SearchService(mock_db)
 
-    def test_get_available_filters_no_subject(self, service, mock_db, mocker):
+    def test_get_available_filters_no_subject(self, service, mock_db):
         """Test getting available filters without subject filter"""
-        mock_questions = [
-            Question(
-                id=uuid4(),
-                subject_id=uuid4(),
-                question_text="Q1",
-                max_marks=8,
-                source_paper="9708_s22_qp_22",
-                paper_number=22,
-                question_number=1,
-                year=2022,
-                session="MAY_JUNE",
-                difficulty="medium",
-            ),
-            Question(
-                id=uuid4(),
-                subject_id=uuid4(),
-                question_text="Q2",
-                max_marks=12,
-                source_paper="9708_w21_qp_32",
-                paper_number=32,
-                question_number=1,
-                year=2021,
-                session="OCT_NOV",
-                difficulty="hard",
-            ),
+        # One DISTINCT projection per filter column: years desc, then
+        # sessions, paper numbers, difficulties asc
+        mock_db.exec.side_effect = [
+            _ExecResult(all=[2022, 2021]),
+            _ExecResult(all=["MAY_JUNE", "OCT_NOV"]),
+            _ExecResult(all=[22, 32]),
+            _ExecResult(all=["hard", "medium"]),
         ]
 
-        mocker.patch.object(mock_db, "exec", return_value=mocker.MagicMock(all=lambda: mock_questions))
-
         filters = service.get_available_filters()
 
         assert filters["years"] == [2022, 2021]  # Sorted desc
-        assert set(filters["sessions"]) == {"MAY_JUNE", "OCT_NOV"}
-        assert set(filters["paper_numbers"]) == {22, 32}
-        assert set(filters["difficulties"]) == {"medium", "hard"}
+        assert filters["sessions"] == ["MAY_JUNE", "OCT_NOV"]
+        assert filters["paper_numbers"] == [22, 32]
+        assert filters["difficulties"] == ["hard", "medium"]
+        assert mock_db.exec.call_count == 4  # No subject lookup, no full rows
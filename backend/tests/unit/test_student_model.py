@@ -9,18 +9,41 @@ Constitutional Requirements:
 - Profile updates must set updated_at timestamp
 """
 
-from datetime import datetime
-from uuid import uuid4
+import time
+from datetime import datetime, timezone
+from itertools import count
+from uuid import UUID, uuid4
 
 import pytest
 from sqlmodel import Session, select
 
 from src.models.student import Student
 
+# Fixed ID for tests that only need some valid UUID; uuid4() stays in
+# test_student_auto_id_generation, where generation is the point
+FIXED_STUDENT_ID = UUID("00000000-0000-4000-8000-000000000001")
+
+_email_counter = count(1)
+
+
+def make_student(**overrides) -> Student:
+    """Build a Student with valid defaults, overridable per test
+
+    Centralizes the repeated keyword soup (unique email, bcrypt-shaped
+    hash, name) so each test states only the fields it cares about.
+    """
+    fields = {
+        "email": f"student{next(_email_counter)}@example.com",
+        "password_hash": "$2b$12$hashed",
+        "full_name": "Test Student",
+    }
+    fields.update(overrides)
+    return Student(**fields)
+
 
 def test_student_creation():
     """Test creating a Student instance with valid data"""
-    student_id = uuid4()
+    student_id = FIXED_STUDENT_ID
     student = Student(
         id=student_id,
         email="test@example.com",
@@ -40,11 +63,7 @@ def test_student_creation():
 
 def test_student_auto_id_generation():
     """Test that Student auto-generates UUID if not provided"""
-    student = Student(
-        email="auto@example.com",
-        password_hash="$2b$12$hashed",
-        full_name="Auto ID Student",
-    )
+    student = make_student(full_name="Auto ID Student")
 
     assert student.id is not None
     assert isinstance(student.id, type(uuid4()))
@@ -52,24 +71,19 @@ def test_student_auto_id_generation():
 
 def test_student_auto_created_at():
     """Test that created_at is automatically set"""
-    before = datetime.utcnow()
-    student = Student(
-        email="time@example.com",
-        password_hash="$2b$12$hashed",
-        full_name="Time Test",
-    )
-    after = datetime.utcnow()
+    # Epoch-second bounds with 1s tolerance: no tz-awareness assumptions,
+    # so the assertion survives a model switch to datetime.now(tz=UTC)
+    before = time.time() - 1
+    student = make_student(full_name="Time Test")
+    after = time.time() + 1
 
-    assert before <= student.created_at <= after
+    created_ts = student.created_at.replace(tzinfo=timezone.utc).timestamp()
+    assert before <= created_ts <= after
 
 
 def test_student_update_profile_full_name():
     """Test updating student profile (full_name only)"""
-    student = Student(
-        email="update@example.com",
-        password_hash="$2b$12$hashed",
-        full_name="Original Name",
-    )
+    student = make_student(full_name="Original Name")
 
     # Initially no updated_at
     assert student.updated_at is None
@@ -84,9 +98,7 @@ def test_student_update_profile_full_name():
 
 def test_student_update_profile_target_grades():
     """Test updating student profile (target_grades only)"""
-    student = Student(
-        email="grades@example.com",
-        password_hash="$2b$12$hashed",
+    student = make_student(
         full_name="Grades Student",
         target_grades={"9708": "A"},
     )
@@ -101,11 +113,7 @@ def test_student_update_profile_target_grades():
 
 def test_student_update_profile_both():
     """Test updating both full_name and target_grades"""
-    student = Student(
-        email="both@example.com",
-        password_hash="$2b$12$hashed",
-        full_name="Old Name",
-    )
+    student = make_student(full_name="Old Name")
 
     student.update_profile(
         full_name="New Name",
@@ -119,11 +127,7 @@ def test_student_update_profile_both():
 
 def test_student_update_profile_no_args():
     """Test calling update_profile with no arguments (should still update timestamp)"""
-    student = Student(
-        email="noargs@example.com",
-        password_hash="$2b$12$hashed",
-        full_name="Test",
-    )
+    student = make_student(full_name="Test")
 
     original_name = student.full_name
     student.update_profile()
@@ -134,11 +138,7 @@ def test_student_update_profile_no_args():
 
 def test_student_repr():
     """Test string representation of Student"""
-    student = Student(
-        email="repr@example.com",
-        password_hash="$2b$12$hashed",
-        full_name="Repr Test",
-    )
+    student = make_student(email="repr@example.com", full_name="Repr Test")
 
     repr_str = repr(student)
     assert "Student" in repr_str
@@ -147,16 +147,15 @@ def test_student_repr():
     assert str(student.id) in repr_str
 
 
-# Database tests (requires session fixture)
+# Database tests (requires session fixture). Grouped onto one xdist
+# worker so parallel runs (-n auto --dist loadgroup) keep all users of
+# the shared transactional session fixture in a single process.
 
 
+@pytest.mark.xdist_group("db")
 def test_student_save_to_database(session: Session):
     """Test saving Student to database"""
-    student = Student(
-        email="db@example.com",
-        password_hash="$2b$12$hashed",
-        full_name="DB Test",
-    )
+    student = make_student(email="db@example.com", full_name="DB Test")
 
     session.add(student)
     session.commit()
@@ -170,25 +169,18 @@ def test_student_save_to_database(session: Session):
     assert saved_student.full_name == "DB Test"
 
 
+@pytest.mark.xdist_group("db")
 def test_student_email_uniqueness(session: Session):
     """Test that duplicate emails violate unique constraint"""
     from sqlalchemy.exc import IntegrityError
 
     # Create first student
-    student1 = Student(
-        email="unique@example.com",
-        password_hash="$2b$12$hashed1",
-        full_name="First",
-    )
+    student1 = make_student(email="unique@example.com", full_name="First")
     session.add(student1)
     session.commit()
 
     # Try to create second student with same email
-    student2 = Student(
-        email="unique@example.com",  # Same email!
-        password_hash="$2b$12$hashed2",
-        full_name="Second",
-    )
+    student2 = make_student(email="unique@example.com", full_name="Second")  # Same email!
     session.add(student2)
 
     # Should raise IntegrityError
@@ -196,6 +188,7 @@ def test_student_email_uniqueness(session: Session):
         session.commit()
 
 
+@pytest.mark.xdist_group("db")
 def test_student_target_grades_json_storage(session: Session):
     """Test that target_grades dict is properly stored as JSON"""
     target_grades = {
@@ -204,9 +197,8 @@ def test_student_target_grades_json_storage(session: Session):
         "9709": "B",
     }
 
-    student = Student(
+    student = make_student(
         email="json@example.com",
-        password_hash="$2b$12$hashed",
         full_name="JSON Test",
         target_grades=target_grades,
     )
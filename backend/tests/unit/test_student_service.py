@@ -21,14 +21,45 @@ from src.services.student_service import (
     student_to_response,
 )
 
+# Keep all users of the shared transactional session fixture on one
+# pytest-xdist worker (-n auto --dist loadgroup); pure-function suites
+# like the SM-2 tests stay ungrouped and spread freely
+pytestmark = pytest.mark.xdist_group("db")
+
+
+def _req(email: str, password: str = "Pass1234", full_name: str = "Test") -> RegisterRequest:
+    """Build a RegisterRequest without running validation
+
+    model_construct skips the EmailStr/password validators, which these
+    tests don't exercise - they test the service, not the schema.
+    test_register_request_validates keeps the real constructor covered.
+    """
+    return RegisterRequest.model_construct(
+        email=email, password=password, full_name=full_name
+    )
+
+
+
+def test_register_request_validates():
+    """Real RegisterRequest construction still enforces its validators"""
+    request = RegisterRequest(
+        email="valid@example.com",
+        password="Pass1234",
+        full_name="Valid Student",
+    )
+    assert request.email == "valid@example.com"
+
+    with pytest.raises(ValueError):
+        RegisterRequest(
+            email="not-an-email",
+            password="Pass1234",
+            full_name="Invalid Email",
+        )
+
 
 def test_create_student_success(session: Session):
     """Test successful student creation with valid data"""
-    registration_data = RegisterRequest(
-        email="new@example.com",
-        password="SecurePass123",
-        full_name="New Student",
-    )
+    registration_data = _req("new@example.com", password="SecurePass123", full_name="New Student")
 
     student = create_student(session, registration_data)
 
@@ -36,44 +67,50 @@ def test_create_student_success(session: Session):
     assert student.full_name == "New Student"
     assert student.password_hash is not None
     assert student.password_hash != "SecurePass123"  # Should be hashed
-    assert student.password_hash.startswith("$2b$12$")  # Bcrypt format
+    assert student.password_hash.startswith("$2b$")  # Bcrypt format
     assert student.id is not None  # UUID generated
     assert student.created_at is not None
 
 
+@pytest.mark.slow
 def test_create_student_password_hashed(session: Session):
     """Test that password is bcrypt-hashed (Constitutional Principle I)"""
-    registration_data = RegisterRequest(
-        email="hash@example.com",
-        password="PlainPassword",
-        full_name="Hash Test",
-    )
+    registration_data = _req("hash@example.com", password="PlainPassword", full_name="Hash Test")
 
     student = create_student(session, registration_data)
 
     # Password MUST be hashed (never plain text)
     assert student.password_hash != "PlainPassword"
-    assert "$2b$12$" in student.password_hash  # Bcrypt with work factor 12
+    assert student.password_hash.startswith("$2b$")  # Bcrypt (test work factor)
     assert len(student.password_hash) == 60  # Bcrypt hash length
 
 
+def test_production_bcrypt_cost():
+    """Production default work factor stays 12 (Constitutional Principle I)
+
+    Tests run with BCRYPT_ROUNDS=4 for speed; the Settings field default
+    is what production (no env override) uses.
+    """
+    from src.config import Settings
+
+    assert Settings.model_fields["bcrypt_rounds"].default == 12
+
+
 def test_create_student_duplicate_email(session: Session):
     """Test that duplicate email raises EmailAlreadyExistsError"""
-    # Create first student
-    registration_data_1 = RegisterRequest(
+    # Seed the occupied email directly - only the duplicate-path
+    # create_student call below is under test, so the seed row skips
+    # bcrypt entirely (nothing ever verifies its hash)
+    seed = Student(
         email="duplicate@example.com",
-        password="Pass1234",  # 8 chars minimum
+        password_hash="$2b$12$precomputed",
         full_name="First Student",
     )
-    create_student(session, registration_data_1)
-    session.commit()  # Commit first student
+    session.add(seed)
+    session.flush()  # Make first student visible without ending the transaction
 
     # Try to create second student with same email
-    registration_data_2 = RegisterRequest(
-        email="duplicate@example.com",  # Same email!
-        password="Pass5678",  # 8 chars minimum
-        full_name="Second Student",
-    )
+    registration_data_2 = _req("duplicate@example.com", password="Pass5678", full_name="Second Student")
 
     with pytest.raises(EmailAlreadyExistsError) as exc_info:
         create_student(session, registration_data_2)
@@ -84,21 +121,17 @@ def test_create_student_duplicate_email(session: Session):
 
 def test_create_student_rollback_on_error(session: Session):
     """Test that session is rolled back on duplicate email error"""
-    # Create first student
-    registration_data_1 = RegisterRequest(
+    # Seed the occupied email directly (see duplicate-email test above)
+    seed = Student(
         email="rollback@example.com",
-        password="Pass1234",
+        password_hash="$2b$12$precomputed",
         full_name="First",
     )
-    create_student(session, registration_data_1)
-    session.commit()
+    session.add(seed)
+    session.flush()
 
     # Try duplicate (should rollback)
-    registration_data_2 = RegisterRequest(
-        email="rollback@example.com",
-        password="Pass5678",
-        full_name="Second",
-    )
+    registration_data_2 = _req("rollback@example.com", password="Pass5678", full_name="Second")
 
     try:
         create_student(session, registration_data_2)
@@ -107,25 +140,22 @@ def test_create_student_rollback_on_error(session: Session):
 
     # Session should still be usable (rollback successful)
     # Create a different student to verify
-    registration_data_3 = RegisterRequest(
-        email="different@example.com",
-        password="Pass7890",
-        full_name="Third",
-    )
+    registration_data_3 = _req("different@example.com", password="Pass7890", full_name="Third")
     student3 = create_student(session, registration_data_3)
     assert student3.email == "different@example.com"
 
 
 def test_get_student_by_email_found(session: Session):
     """Test finding existing student by email"""
-    # Create student
-    registration_data = RegisterRequest(
+    # Insert directly: get_student_by_email has no bcrypt dependency,
+    # so the seed row doesn't need a real hash
+    created_student = Student(
         email="find@example.com",
-        password="Pass1234",
+        password_hash="$2b$12$precomputed",
         full_name="Find Me",
     )
-    created_student = create_student(session, registration_data)
-    session.commit()
+    session.add(created_student)
+    session.flush()
 
     # Find by email
     found_student = get_student_by_email(session, "find@example.com")
@@ -144,14 +174,15 @@ def test_get_student_by_email_not_found(session: Session):
 
 def test_get_student_by_email_case_sensitive(session: Session):
     """Test that email search is case-sensitive"""
-    # Create student with lowercase email
-    registration_data = RegisterRequest(
-        email="lowercase@example.com",
-        password="Pass1234",
-        full_name="Lowercase",
+    # Insert student with lowercase email directly (no bcrypt needed)
+    session.add(
+        Student(
+            email="lowercase@example.com",
+            password_hash="$2b$12$precomputed",
+            full_name="Lowercase",
+        )
     )
-    create_student(session, registration_data)
-    session.commit()
+    session.flush()
 
     # Search with uppercase (should not find)
     result = get_student_by_email(session, "LOWERCASE@EXAMPLE.COM")
@@ -162,13 +193,20 @@ def test_get_student_by_email_case_sensitive(session: Session):
     assert result is not None
 
 
-def test_student_to_response_excludes_password():
-    """Test that student_to_response excludes password_hash (security)"""
+@pytest.mark.parametrize(
+    "target_grades",
+    [
+        pytest.param({"9708": "A*"}, id="with_target_grades"),
+        pytest.param(None, id="none_target_grades"),
+    ],
+)
+def test_student_to_response(target_grades):
+    """student_to_response carries public fields and drops password_hash"""
     student = Student(
         email="response@example.com",
         password_hash="$2b$12$secret_hash_here",
         full_name="Response Test",
-        target_grades={"9708": "A*"},
+        target_grades=target_grades,
     )
 
     response = student_to_response(student)
@@ -180,49 +218,29 @@ def test_student_to_response_excludes_password():
     assert response.id == student.id
     assert response.email == "response@example.com"
     assert response.full_name == "Response Test"
-    assert response.target_grades == {"9708": "A*"}
+    assert response.target_grades == target_grades
     assert response.created_at == student.created_at
 
-    # Check password_hash is NOT in response
+    # Check password_hash is NOT in response (security)
     assert not hasattr(response, "password_hash")
 
 
-def test_student_to_response_with_none_target_grades():
-    """Test student_to_response when target_grades is None"""
-    student = Student(
-        email="notarget@example.com",
-        password_hash="$2b$12$hash",
-        full_name="No Target",
-        target_grades=None,
-    )
-
-    response = student_to_response(student)
-
-    assert response.target_grades is None
-
-
+@pytest.mark.slow
+@pytest.mark.no_bcrypt_cache
 def test_create_student_different_passwords_different_hashes(session: Session):
     """Test that same password for different users gets different hashes (salt)"""
     # Create two students with same password
     student1 = create_student(
         session,
-        RegisterRequest(
-            email="user1@example.com",
-            password="SamePassword123",
-            full_name="User 1",
-        ),
+        _req("user1@example.com", password="SamePassword123", full_name="User 1"),
     )
 
     student2 = create_student(
         session,
-        RegisterRequest(
-            email="user2@example.com",
-            password="SamePassword123",  # Same password!
-            full_name="User 2",
-        ),
+        _req("user2@example.com", password="SamePassword123", full_name="User 2"),
     )
 
     # Hashes should be different (bcrypt uses random salt)
     assert student1.password_hash != student2.password_hash
-    assert student1.password_hash.startswith("$2b$12$")
-    assert student2.password_hash.startswith("$2b$12$")
+    assert student1.password_hash.startswith("$2b$")
+    assert student2.password_hash.startswith("$2b$")
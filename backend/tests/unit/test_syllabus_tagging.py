@@ -14,31 +14,30 @@ Constitutional Requirement:
 """
 
 import pytest
+from collections import Counter
+from itertools import chain
 from uuid import uuid4
 
 from src.models.question import Question
-from src.models.subject import Subject
 from src.models.syllabus_point import SyllabusPoint
 
+# Static Question kwargs shared by every fixture/test in this module;
+# call sites splat these and override only what the test cares about
+_Q_DEFAULTS = dict(
+    max_marks=8,
+    source_paper="9708_s22_qp_22",
+    paper_number=22,
+    year=2022,
+    session="MAY_JUNE",
+    difficulty="medium",
+)
+
 
 class TestSyllabusPointCRUD:
     """Test syllabus point CRUD operations"""
 
-    @pytest.fixture
-    def mock_db(self, mocker):
-        """Mock database session"""
-        return mocker.MagicMock()
-
-    @pytest.fixture
-    def sample_subject(self):
-        """Create sample subject"""
-        return Subject(
-            id=uuid4(),
-            code="9708",
-            name="Economics",
-            level="A",
-            syllabus_year="2023-2025",
-        )
+    # mock_db comes from tests/unit/conftest.py (shared reset stub)
+    # sample_subject is module-scoped in tests/unit/conftest.py
 
     @pytest.fixture
     def sample_syllabus_point(self, sample_subject):
@@ -113,11 +112,6 @@ class TestSyllabusPointCRUD:
 class TestQuestionTagging:
     """Test question tagging functionality"""
 
-    @pytest.fixture
-    def mock_db(self, mocker):
-        """Mock database session"""
-        return mocker.MagicMock()
-
     @pytest.fixture
     def sample_question(self):
         """Create sample question"""
@@ -125,39 +119,19 @@ class TestQuestionTagging:
             id=uuid4(),
             subject_id=uuid4(),
             question_text="Sample question",
-            max_marks=8,
-            source_paper="9708_s22_qp_22",
-            paper_number=22,
             question_number=1,
-            year=2022,
-            session="MAY_JUNE",
-            difficulty="medium",
             syllabus_point_ids=[],  # Initially no tags
+            **_Q_DEFAULTS,
         )
 
-    @pytest.fixture
-    def sample_syllabus_points(self):
-        """Create sample syllabus points"""
-        subject_id = uuid4()
-        return [
-            SyllabusPoint(
-                id=uuid4(),
-                subject_id=subject_id,
-                code="9708.1.1",
-                description="Economic problem",
-            ),
-            SyllabusPoint(
-                id=uuid4(),
-                subject_id=subject_id,
-                code="9708.1.2",
-                description="Opportunity cost",
-            ),
-        ]
+    # sample_syllabus_points is module-scoped in tests/unit/conftest.py;
+    # these tests only need two of them and treat the list as read-only
+    # (tags are mutated on the function-scoped sample_question instead)
 
     def test_add_tags_to_question(self, sample_question, sample_syllabus_points):
         """Test adding syllabus point tags to a question"""
         # Add tags
-        sp_ids = [str(sp.id) for sp in sample_syllabus_points]
+        sp_ids = [str(sp.id) for sp in sample_syllabus_points[:2]]
         sample_question.syllabus_point_ids = sp_ids
 
         assert len(sample_question.syllabus_point_ids) == 2
@@ -166,7 +140,7 @@ class TestQuestionTagging:
     def test_remove_tag_from_question(self, sample_question, sample_syllabus_points):
         """Test removing a syllabus point tag from a question"""
         # Add tags first
-        sp_ids = [str(sp.id) for sp in sample_syllabus_points]
+        sp_ids = [str(sp.id) for sp in sample_syllabus_points[:2]]
         sample_question.syllabus_point_ids = sp_ids
 
         # Remove one tag
@@ -177,22 +151,24 @@ class TestQuestionTagging:
         assert tag_to_remove not in sample_question.syllabus_point_ids
 
     def test_prevent_duplicate_tags(self, sample_question, sample_syllabus_points):
-        """Test that duplicate tags are prevented"""
+        """Test that duplicate tags are prevented (order-preserving)"""
         sp_id = str(sample_syllabus_points[0].id)
+        other_id = str(sample_syllabus_points[1].id)
 
         # Add tag twice
-        tags = [sp_id, sp_id]
-        # Deduplicate (as done in route handler)
-        unique_tags = list(set(tags))
+        tags = [sp_id, other_id, sp_id]
+        # Deduplicate (as done in route handler): dict.fromkeys keeps
+        # first-seen order, so the result is deterministic
+        unique_tags = list(dict.fromkeys(tags))
 
-        assert len(unique_tags) == 1
+        assert unique_tags == [sp_id, other_id]
 
-    def test_empty_tags_list(self, sample_question):
+    def test_empty_tags_list(self, sample_question, fake_uuids):
         """Test handling of empty tags list"""
         assert sample_question.syllabus_point_ids == []
 
         # Adding to empty list
-        new_tag = str(uuid4())
+        new_tag = fake_uuids[0]
         sample_question.syllabus_point_ids.append(new_tag)
 
         assert len(sample_question.syllabus_point_ids) == 1
@@ -201,34 +177,9 @@ class TestQuestionTagging:
 class TestSyllabusCoverage:
     """Test syllabus coverage statistics"""
 
-    @pytest.fixture
-    def mock_db(self, mocker):
-        """Mock database session"""
-        return mocker.MagicMock()
-
-    @pytest.fixture
-    def sample_subject(self):
-        """Create sample subject"""
-        return Subject(
-            id=uuid4(),
-            code="9708",
-            name="Economics",
-            level="A",
-            syllabus_year="2023-2025",
-        )
-
-    @pytest.fixture
-    def sample_syllabus_points(self, sample_subject):
-        """Create 5 syllabus points"""
-        return [
-            SyllabusPoint(
-                id=uuid4(),
-                subject_id=sample_subject.id,
-                code=f"9708.1.{i}",
-                description=f"Topic {i}",
-            )
-            for i in range(1, 6)
-        ]
+    # mock_db comes from tests/unit/conftest.py (shared reset stub)
+    # sample_subject and sample_syllabus_points (5 points, codes
+    # 9708.1.1-9708.1.5) are module-scoped in tests/unit/conftest.py
 
     @pytest.fixture
     def sample_questions(self, sample_subject, sample_syllabus_points):
@@ -243,14 +194,9 @@ class TestSyllabusCoverage:
                     id=uuid4(),
                     subject_id=sample_subject.id,
                     question_text=f"Question {i+1}",
-                    max_marks=8,
-                    source_paper="9708_s22_qp_22",
-                    paper_number=22,
                     question_number=i + 1,
-                    year=2022,
-                    session="MAY_JUNE",
-                    difficulty="medium",
                     syllabus_point_ids=[str(sample_syllabus_points[i].id)],
+                    **_Q_DEFAULTS,
                 )
             )
 
@@ -262,10 +208,10 @@ class TestSyllabusCoverage:
         total_sp = len(sample_syllabus_points)
 
         # Count how many syllabus points have at least one question
-        sp_with_questions = set()
-        for q in sample_questions:
-            if q.syllabus_point_ids:
-                sp_with_questions.update(q.syllabus_point_ids)
+        # (single C-level union instead of a Python-level update loop)
+        sp_with_questions = set().union(
+            *(q.syllabus_point_ids for q in sample_questions if q.syllabus_point_ids)
+        )
 
         tagged_sp = len(sp_with_questions)
         coverage = (tagged_sp / total_sp * 100) if total_sp > 0 else 0
@@ -276,10 +222,9 @@ class TestSyllabusCoverage:
     def test_identify_untagged_syllabus_points(self, sample_syllabus_points, sample_questions):
         """Test identification of untagged syllabus points"""
         # Get all question tags
-        tagged_sp_ids = set()
-        for q in sample_questions:
-            if q.syllabus_point_ids:
-                tagged_sp_ids.update(q.syllabus_point_ids)
+        tagged_sp_ids = set().union(
+            *(q.syllabus_point_ids for q in sample_questions if q.syllabus_point_ids)
+        )
 
         # Find untagged syllabus points
         untagged = [
@@ -292,16 +237,13 @@ class TestSyllabusCoverage:
 
     def test_count_questions_per_syllabus_point(self, sample_syllabus_points, sample_questions):
         """Test counting questions per syllabus point"""
-        questions_per_sp = {}
-
-        for sp in sample_syllabus_points:
-            sp_id_str = str(sp.id)
-            count = sum(
-                1
-                for q in sample_questions
-                if q.syllabus_point_ids and sp_id_str in q.syllabus_point_ids
+        # Counter over all tags is O(S+Q) vs the O(S*Q) nested scan
+        tag_counts = Counter(
+            chain.from_iterable(
+                q.syllabus_point_ids for q in sample_questions if q.syllabus_point_ids
             )
-            questions_per_sp[sp.code] = count
+        )
+        questions_per_sp = {sp.code: tag_counts[str(sp.id)] for sp in sample_syllabus_points}
 
         # Syllabus points 1-3 should have 1 question each
         assert questions_per_sp["9708.1.1"] == 1
@@ -328,23 +270,17 @@ class TestSyllabusCoverage:
                 id=uuid4(),
                 subject_id=uuid4(),
                 question_text=f"Question {i+1}",
-                max_marks=8,
-                source_paper="9708_s22_qp_22",
-                paper_number=22,
                 question_number=i + 1,
-                year=2022,
-                session="MAY_JUNE",
-                difficulty="medium",
                 syllabus_point_ids=[str(sample_syllabus_points[i].id)],
+                **_Q_DEFAULTS,
             )
             for i in range(len(sample_syllabus_points))
         ]
 
         total_sp = len(sample_syllabus_points)
-        tagged_sp_ids = set()
-        for q in questions:
-            if q.syllabus_point_ids:
-                tagged_sp_ids.update(q.syllabus_point_ids)
+        tagged_sp_ids = set().union(
+            *(q.syllabus_point_ids for q in questions if q.syllabus_point_ids)
+        )
 
         tagged_sp = len(tagged_sp_ids)
         coverage = (tagged_sp / total_sp * 100)
@@ -355,43 +291,45 @@ class TestSyllabusCoverage:
 class TestSyllabusPointValidation:
     """Test syllabus point validation"""
 
-    def test_valid_code_formats(self):
-        """Test valid syllabus code formats"""
-        valid_codes = [
+    @pytest.mark.parametrize(
+        "code",
+        [
             "9708.1.1",
             "9708.1",
             "9706.2.3.1",
             "8021.A.1",
-        ]
-
-        for code in valid_codes:
-            sp = SyllabusPoint(
-                id=uuid4(),
-                subject_id=uuid4(),
-                code=code,
-                description="Test",
-            )
-            assert sp.is_valid_code_format(), f"Code {code} should be valid"
-
-    def test_invalid_code_formats(self):
+        ],
+    )
+    def test_valid_code_formats(self, code):
+        """Test valid syllabus code formats"""
+        sp = SyllabusPoint(
+            id=uuid4(),
+            subject_id=uuid4(),
+            code=code,
+            description="Test",
+        )
+        assert sp.is_valid_code_format(), f"Code {code} should be valid"
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            pytest.param("invalid", id="no_dot"),
+            pytest.param("9708", id="single_part"),
+            pytest.param("", id="empty"),
+            pytest.param("9708.", id="empty_part_after_dot"),
+            pytest.param(".9708", id="empty_part_before_dot"),
+            pytest.param("9708..1", id="empty_part_in_middle"),
+        ],
+    )
+    def test_invalid_code_formats(self, code):
         """Test invalid syllabus code formats"""
-        invalid_codes = [
-            "invalid",  # No dot
-            "9708",  # Single part
-            "",  # Empty
-            "9708.",  # Empty part after dot
-            ".9708",  # Empty part before dot
-            "9708..1",  # Empty part in middle
-        ]
-
-        for code in invalid_codes:
-            sp = SyllabusPoint(
-                id=uuid4(),
-                subject_id=uuid4(),
-                code=code,
-                description="Test",
-            )
-            assert not sp.is_valid_code_format(), f"Code '{code}' should be invalid"
+        sp = SyllabusPoint(
+            id=uuid4(),
+            subject_id=uuid4(),
+            code=code,
+            description="Test",
+        )
+        assert not sp.is_valid_code_format(), f"Code '{code}' should be invalid"
 
     def test_code_uniqueness_per_subject(self):
         """Test that syllabus code should be unique per subject"""
@@ -420,41 +358,31 @@ class TestSyllabusPointValidation:
 class TestQuestionTaggingEdgeCases:
     """Test edge cases in question tagging"""
 
-    def test_tag_question_with_multiple_syllabus_points(self):
+    def test_tag_question_with_multiple_syllabus_points(self, fake_uuids):
         """Test tagging a question with multiple syllabus points"""
         question = Question(
             id=uuid4(),
             subject_id=uuid4(),
             question_text="Complex question",
-            max_marks=12,
-            source_paper="9708_s22_qp_22",
-            paper_number=22,
             question_number=1,
-            year=2022,
-            session="MAY_JUNE",
-            difficulty="hard",
+            **(_Q_DEFAULTS | dict(max_marks=12, difficulty="hard")),
         )
 
-        # Add 3 syllabus points
-        sp_ids = [str(uuid4()) for _ in range(3)]
+        # Add 3 syllabus points (from the precomputed id pool)
+        sp_ids = list(fake_uuids[:3])
         question.syllabus_point_ids = sp_ids
 
         assert len(question.syllabus_point_ids) == 3
 
-    def test_tag_none_value(self):
+    def test_tag_none_value(self, fake_uuids):
         """Test handling of None value for syllabus_point_ids"""
         question = Question(
             id=uuid4(),
             subject_id=uuid4(),
             question_text="Question",
-            max_marks=8,
-            source_paper="9708_s22_qp_22",
-            paper_number=22,
             question_number=1,
-            year=2022,
-            session="MAY_JUNE",
-            difficulty="medium",
             syllabus_point_ids=None,
+            **_Q_DEFAULTS,
         )
 
         # Initialize empty list if None
@@ -462,34 +390,32 @@ class TestQuestionTaggingEdgeCases:
         assert current_tags == []
 
         # Add tags
-        new_tag = str(uuid4())
+        new_tag = fake_uuids[0]
         current_tags.append(new_tag)
         question.syllabus_point_ids = current_tags
 
         assert len(question.syllabus_point_ids) == 1
 
-    def test_remove_non_existent_tag(self):
+    def test_remove_non_existent_tag(self, fake_uuids):
         """Test removing a tag that doesn't exist"""
         question = Question(
             id=uuid4(),
             subject_id=uuid4(),
             question_text="Question",
-            max_marks=8,
-            source_paper="9708_s22_qp_22",
-            paper_number=22,
             question_number=1,
-            year=2022,
-            session="MAY_JUNE",
-            difficulty="medium",
-            syllabus_point_ids=[str(uuid4())],
+            syllabus_point_ids=[fake_uuids[0]],
+            **_Q_DEFAULTS,
         )
 
         initial_count = len(question.syllabus_point_ids)
 
-        # Try to remove non-existent tag
-        non_existent_tag = str(uuid4())
-        if non_existent_tag in question.syllabus_point_ids:
+        # Try to remove non-existent tag (single-pass remove, as in the
+        # route handler, instead of a membership scan + remove scan)
+        non_existent_tag = fake_uuids[1]
+        try:
             question.syllabus_point_ids.remove(non_existent_tag)
+        except ValueError:
+            pass
 
         # Count should remain same
         assert len(question.syllabus_point_ids) == initial_count
@@ -15,8 +15,9 @@ Constitutional Compliance:
 
 import pytest
 import json
-from unittest.mock import Mock, AsyncMock, MagicMock
-from uuid import UUID, uuid4
+from functools import lru_cache
+from unittest.mock import ANY, Mock, AsyncMock
+from uuid import uuid4
 
 from src.services.teaching_service import (
     explain_concept,
@@ -27,28 +28,66 @@ from src.services.teaching_service import (
 from src.schemas.teaching_schemas import ExplainConceptRequest, TopicExplanation
 from src.models.syllabus_point import SyllabusPoint
 from src.models.student import Student
-from src.ai_integration.llm_fallback import LLMProvider
+from src.ai_integration.llm_fallback import LLMFallbackOrchestrator, LLMProvider
+from sqlmodel import Session
+
+# asyncio_mode = "auto" (pyproject) collects async tests without per-test
+# markers; a module-scoped loop avoids one event-loop spin-up per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@lru_cache(maxsize=None)
+def _make_request(
+    syllabus_point_id,
+    student_id,
+    include_diagrams=True,
+    include_practice=True,
+    context=None,
+):
+    """Build (and cache) an ExplainConceptRequest.
+
+    The tests reuse a handful of kwarg combinations, so each distinct
+    request is validated by Pydantic once instead of per test.
+    """
+    return ExplainConceptRequest(
+        syllabus_point_id=syllabus_point_id,
+        student_id=student_id,
+        include_diagrams=include_diagrams,
+        include_practice=include_practice,
+        context=context,
+    )
+
 
+def _make_session(*first_results):
+    """Mock DB session whose exec().first() yields the given rows in order.
 
-@pytest.fixture
-def mock_session():
-    """Create mock database session."""
-    session = Mock()
-    session.exec = Mock()
+    Called with no arguments, the first lookup returns None (row missing).
+    """
+    # spec= keeps the mock to Session's real surface (and skips building
+    # MagicMock children for arbitrary attribute accesses)
+    session = Mock(spec=Session)
+    if first_results:
+        session.exec.return_value.first.side_effect = list(first_results)
+    else:
+        session.exec.return_value.first.return_value = None
     return session
 
 
-@pytest.fixture
-def mock_llm_orchestrator():
-    """Create mock LLM fallback orchestrator."""
-    orchestrator = AsyncMock()
-    orchestrator.generate_with_fallback = AsyncMock()
+def _make_orchestrator(llm_text=None, provider=LLMProvider.ANTHROPIC, error=None):
+    """Mock LLM orchestrator pre-wired with a response (or an error)."""
+    # AsyncMock already materializes generate_with_fallback as an
+    # AsyncMock child; no need to allocate a replacement
+    orchestrator = AsyncMock(spec=LLMFallbackOrchestrator)
+    if error is not None:
+        orchestrator.generate_with_fallback.side_effect = error
+    else:
+        orchestrator.generate_with_fallback.return_value = (llm_text, provider)
     return orchestrator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_syllabus_point():
-    """Create sample syllabus point."""
+    """Create sample syllabus point (shared; tests must not mutate it)."""
     return SyllabusPoint(
         id=uuid4(),
         code="9708.1.1",
@@ -59,7 +98,7 @@ def sample_syllabus_point():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_student():
     """Create sample student."""
     return Student(
@@ -70,111 +109,142 @@ def sample_student():
     )
 
 
-@pytest.fixture
-def sample_llm_response():
-    """Create sample LLM response JSON."""
-    return {
-        "definition": {
-            "precise_definition": "Scarcity is the fundamental economic problem of having unlimited wants but limited resources.",
-            "key_terms": [
-                {"term": "Scarcity", "definition": "Unlimited wants vs. limited resources"},
-                {"term": "Resources", "definition": "Factors of production (land, labor, capital, entrepreneurship)"},
-            ],
+# Shared LLM payload, built once at import time; the serialized form is
+# reused by every happy-path test instead of re-dumping per test.
+# The nested sequences are tuples so no test can mutate the shared
+# payload in place (json.dumps writes tuples as arrays)
+_SAMPLE_LLM_RESPONSE = {
+    "definition": {
+        "precise_definition": "Scarcity is the fundamental economic problem of having unlimited wants but limited resources.",
+        "key_terms": (
+            {"term": "Scarcity", "definition": "Unlimited wants vs. limited resources"},
+            {"term": "Resources", "definition": "Factors of production (land, labor, capital, entrepreneurship)"},
+        ),
+    },
+    "explanation": {
+        "core_principles": "Scarcity forces individuals and societies to make choices about how to allocate limited resources."
+    },
+    "examples": (
+        {
+            "title": "Personal Budget Constraint",
+            "scenario": "Student has $100/week budget but wants $200 worth of goods",
+            "analysis": "Must choose which goods to purchase, facing opportunity cost of foregone alternatives",
         },
-        "explanation": {
-            "core_principles": "Scarcity forces individuals and societies to make choices about how to allocate limited resources."
+        {
+            "title": "Production Possibilities Frontier",
+            "scenario": "Economy can produce guns OR butter, not both at maximum",
+            "analysis": "Resources allocated to guns cannot be used for butter production",
         },
-        "examples": [
-            {
-                "title": "Personal Budget Constraint",
-                "scenario": "Student has $100/week budget but wants $200 worth of goods",
-                "analysis": "Must choose which goods to purchase, facing opportunity cost of foregone alternatives",
-            },
-            {
-                "title": "Production Possibilities Frontier",
-                "scenario": "Economy can produce guns OR butter, not both at maximum",
-                "analysis": "Resources allocated to guns cannot be used for butter production",
-            },
-        ],
-        "visual_aids": [
-            {
-                "type": "diagram",
-                "title": "Production Possibilities Curve (PPC)",
-                "description": "Shows maximum combinations of two goods economy can produce with given resources",
-            }
-        ],
-        "worked_examples": [
-            {
-                "problem": "A farmer can produce 100 wheat OR 50 corn. What is the opportunity cost of 1 corn?",
-                "step_by_step_solution": "1. Calculate ratio: 100 wheat / 50 corn = 2 wheat per corn\n2. Opportunity cost of 1 corn = 2 wheat",
-                "marks_breakdown": "1 mark for calculation, 1 mark for interpretation",
-            }
-        ],
-        "common_misconceptions": [
-            {
-                "misconception": "Scarcity only affects poor countries",
-                "why_wrong": "All societies face scarcity, regardless of wealth level",
-                "correct_understanding": "Even wealthy nations have finite resources and must make choices",
-            }
-        ],
-        "practice_problems": [
-            {
-                "question": "Explain why scarcity is considered the fundamental economic problem. [4 marks]",
-                "difficulty": "medium",
-                "answer_outline": "Define scarcity, explain unlimited wants vs limited resources, discuss need for choice, give example",
-                "marks": 4,
-            },
-            {
-                "question": "Using a Production Possibilities Curve diagram, explain the concept of opportunity cost. [6 marks]",
-                "difficulty": "medium",
-                "answer_outline": "Draw PPC, explain trade-offs, calculate opportunity cost from diagram, provide real-world example",
-                "marks": 6,
-            },
-            {
-                "question": "Discuss how scarcity affects resource allocation in a market economy. [8 marks]",
-                "difficulty": "hard",
-                "answer_outline": "Define scarcity, explain price mechanism, discuss supply/demand interaction, evaluate efficiency",
-                "marks": 8,
-            },
-        ],
-        "connections": {
-            "syllabus_links": ["9708.1.2", "9708.1.3"],
+    ),
+    "visual_aids": (
+        {
+            "type": "diagram",
+            "title": "Production Possibilities Curve (PPC)",
+            "description": "Shows maximum combinations of two goods economy can produce with given resources",
+        },
+    ),
+    "worked_examples": (
+        {
+            "problem": "A farmer can produce 100 wheat OR 50 corn. What is the opportunity cost of 1 corn?",
+            "step_by_step_solution": "1. Calculate ratio: 100 wheat / 50 corn = 2 wheat per corn\n2. Opportunity cost of 1 corn = 2 wheat",
+            "marks_breakdown": "1 mark for calculation, 1 mark for interpretation",
+        },
+    ),
+    "common_misconceptions": (
+        {
+            "misconception": "Scarcity only affects poor countries",
+            "why_wrong": "All societies face scarcity, regardless of wealth level",
+            "correct_understanding": "Even wealthy nations have finite resources and must make choices",
         },
-    }
+    ),
+    "practice_problems": (
+        {
+            "question": "Explain why scarcity is considered the fundamental economic problem. [4 marks]",
+            "difficulty": "medium",
+            "answer_outline": "Define scarcity, explain unlimited wants vs limited resources, discuss need for choice, give example",
+            "marks": 4,
+        },
+        {
+            "question": "Using a Production Possibilities Curve diagram, explain the concept of opportunity cost. [6 marks]",
+            "difficulty": "medium",
+            "answer_outline": "Draw PPC, explain trade-offs, calculate opportunity cost from diagram, provide real-world example",
+            "marks": 6,
+        },
+        {
+            "question": "Discuss how scarcity affects resource allocation in a market economy. [8 marks]",
+            "difficulty": "hard",
+            "answer_outline": "Define scarcity, explain price mechanism, discuss supply/demand interaction, evaluate efficiency",
+            "marks": 8,
+        },
+    ),
+    "connections": {
+        "syllabus_links": ("9708.1.2", "9708.1.3"),
+    },
+}
+_SAMPLE_LLM_RESPONSE_JSON = json.dumps(_SAMPLE_LLM_RESPONSE)
+_MARKDOWN_WRAPPED_RESPONSE = f"```json\n{_SAMPLE_LLM_RESPONSE_JSON}\n```"
+
+# Error-path payloads, likewise serialized once at import
+_INVALID_JSON_TEXT = "This is not JSON at all"
+_INCOMPLETE_RESPONSE_JSON = json.dumps({"examples": [], "connections": {}})
 
 
 class TestExplainConcept:
     """Test explain_concept() function."""
 
-    @pytest.mark.asyncio
-    async def test_successful_explanation_generation(
+    @pytest.mark.parametrize(
+        ("llm_text", "provider", "include_diagrams", "blank_outcomes", "expected_visuals"),
+        [
+            pytest.param(
+                _SAMPLE_LLM_RESPONSE_JSON, LLMProvider.ANTHROPIC, True, False, 1,
+                id="plain_json",
+            ),
+            pytest.param(
+                _MARKDOWN_WRAPPED_RESPONSE, LLMProvider.ANTHROPIC, True, False, 1,
+                id="markdown_wrapped",
+            ),
+            pytest.param(
+                _SAMPLE_LLM_RESPONSE_JSON, LLMProvider.ANTHROPIC, False, False, 0,
+                id="no_diagrams",
+            ),
+            pytest.param(
+                _SAMPLE_LLM_RESPONSE_JSON, LLMProvider.ANTHROPIC, True, True, 1,
+                id="no_learning_outcomes",
+            ),
+            pytest.param(
+                _SAMPLE_LLM_RESPONSE_JSON, LLMProvider.OPENAI, True, False, 1,
+                id="gpt4_fallback",
+            ),
+        ],
+    )
+    async def test_explanation_generation_variants(
         self,
-        mock_session,
-        mock_llm_orchestrator,
+        llm_text,
+        provider,
+        include_diagrams,
+        blank_outcomes,
+        expected_visuals,
         sample_syllabus_point,
         sample_student,
-        sample_llm_response,
     ):
-        """Test successful concept explanation generation."""
+        """Happy-path variants sharing one arrange/act/assert skeleton:
+        plain JSON, markdown-wrapped JSON, diagrams excluded, missing
+        learning outcomes, and GPT-4 fallback."""
         # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-            include_diagrams=True,
-            include_practice=True,
+        syllabus_point = sample_syllabus_point
+        if blank_outcomes:
+            # Copy the shared syllabus point rather than mutating the
+            # module-scoped fixture other tests also see
+            syllabus_point = sample_syllabus_point.model_copy(
+                update={"learning_outcomes": None}
+            )
+
+        request = _make_request(
+            syllabus_point.id, sample_student.id, include_diagrams=include_diagrams
         )
 
-        # Mock database queries
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        # Mock LLM response
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            json.dumps(sample_llm_response),
-            LLMProvider.ANTHROPIC,
-        )
+        mock_session = _make_session(syllabus_point, sample_student)
+        mock_llm_orchestrator = _make_orchestrator(llm_text, provider)
 
         # Act
         result = await explain_concept(mock_session, request, mock_llm_orchestrator)
@@ -185,371 +255,131 @@ class TestExplainConcept:
         assert "Scarcity" in result.definition
         assert len(result.key_terms) == 2
         assert len(result.examples) == 2
-        assert len(result.visual_aids) == 1  # include_diagrams=True
+        assert len(result.visual_aids) == expected_visuals
         assert len(result.practice_problems) == 3  # include_practice=True (min 3)
-        assert result.generated_by == LLMProvider.ANTHROPIC.value
-
-    @pytest.mark.asyncio
-    async def test_syllabus_point_not_found(
-        self, mock_session, sample_student
-    ):
-        """Test SyllabusPointNotFoundError when syllabus point doesn't exist."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=uuid4(),
-            student_id=sample_student.id,
-        )
-
-        # Mock database query returns None
-        mock_session.exec.return_value.first.return_value = None
-
-        # Act & Assert
-        with pytest.raises(SyllabusPointNotFoundError) as exc_info:
-            await explain_concept(mock_session, request)
-
-        assert "not found" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_student_not_found(
-        self, mock_session, sample_syllabus_point
-    ):
-        """Test StudentNotFoundError when student doesn't exist."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=uuid4(),
-        )
-
-        # Mock database queries: syllabus point exists, student doesn't
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            None,  # Student not found
-        ]
-
-        # Act & Assert
-        with pytest.raises(StudentNotFoundError) as exc_info:
-            await explain_concept(mock_session, request)
-
-        assert "not found" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_llm_timeout_error(
-        self,
-        mock_session,
-        mock_llm_orchestrator,
-        sample_syllabus_point,
-        sample_student,
-    ):
-        """Test LLMResponseError when LLM times out."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-        )
-
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        # Mock LLM timeout
-        mock_llm_orchestrator.generate_with_fallback.side_effect = Exception(
-            "LLM timeout after 30s"
-        )
-
-        # Act & Assert
-        with pytest.raises(LLMResponseError) as exc_info:
-            await explain_concept(mock_session, request, mock_llm_orchestrator)
-
-        assert "Failed to generate explanation" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_invalid_json_response(
-        self,
-        mock_session,
-        mock_llm_orchestrator,
-        sample_syllabus_point,
-        sample_student,
-    ):
-        """Test LLMResponseError when LLM returns invalid JSON."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-        )
-
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        # Mock LLM returns invalid JSON
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            "This is not JSON at all",
-            LLMProvider.ANTHROPIC,
-        )
-
-        # Act & Assert
-        with pytest.raises(LLMResponseError) as exc_info:
-            await explain_concept(mock_session, request, mock_llm_orchestrator)
-
-        assert "not valid JSON" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_json_wrapped_in_markdown(
-        self,
-        mock_session,
-        mock_llm_orchestrator,
-        sample_syllabus_point,
-        sample_student,
-        sample_llm_response,
-    ):
-        """Test successful parsing when LLM wraps JSON in markdown code blocks."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-        )
-
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        # Mock LLM returns JSON wrapped in markdown
-        wrapped_json = f"```json\n{json.dumps(sample_llm_response)}\n```"
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            wrapped_json,
-            LLMProvider.ANTHROPIC,
-        )
-
-        # Act
-        result = await explain_concept(mock_session, request, mock_llm_orchestrator)
-
-        # Assert
-        assert isinstance(result, TopicExplanation)
-        assert "Scarcity" in result.definition
-
-    @pytest.mark.asyncio
-    async def test_missing_required_fields_in_response(
+        assert result.generated_by == provider.value
+
+    @pytest.mark.parametrize(
+        ("missing_row", "llm_text", "llm_error", "expected_exc", "message"),
+        [
+            pytest.param(
+                "syllabus_point", None, None, SyllabusPointNotFoundError,
+                "not found", id="syllabus_point_missing",
+            ),
+            pytest.param(
+                "student", None, None, StudentNotFoundError,
+                "not found", id="student_missing",
+            ),
+            pytest.param(
+                None, None, Exception("LLM timeout after 30s"), LLMResponseError,
+                "Failed to generate explanation", id="llm_timeout",
+            ),
+            pytest.param(
+                None, _INVALID_JSON_TEXT, None, LLMResponseError,
+                "not valid JSON", id="invalid_json",
+            ),
+            pytest.param(
+                None, _INCOMPLETE_RESPONSE_JSON, None, LLMResponseError,
+                "structure invalid", id="missing_required_fields",
+            ),
+        ],
+    )
+    async def test_error_paths(
         self,
-        mock_session,
-        mock_llm_orchestrator,
+        missing_row,
+        llm_text,
+        llm_error,
+        expected_exc,
+        message,
         sample_syllabus_point,
         sample_student,
     ):
-        """Test LLMResponseError when LLM response missing required fields."""
+        """DB-miss and LLM-failure paths share one raise-and-check skeleton."""
         # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-        )
-
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        # Mock LLM returns incomplete JSON (missing definition)
-        incomplete_response = {
-            "examples": [],
-            "connections": {},
-        }
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            json.dumps(incomplete_response),
-            LLMProvider.ANTHROPIC,
-        )
+        if missing_row == "syllabus_point":
+            request = _make_request(uuid4(), sample_student.id)
+            mock_session = _make_session()
+        elif missing_row == "student":
+            request = _make_request(sample_syllabus_point.id, uuid4())
+            mock_session = _make_session(sample_syllabus_point, None)
+        else:
+            request = _make_request(sample_syllabus_point.id, sample_student.id)
+            mock_session = _make_session(sample_syllabus_point, sample_student)
+
+        mock_llm_orchestrator = _make_orchestrator(llm_text, error=llm_error)
 
         # Act & Assert
-        with pytest.raises(LLMResponseError) as exc_info:
+        with pytest.raises(expected_exc) as exc_info:
             await explain_concept(mock_session, request, mock_llm_orchestrator)
 
-        assert "structure invalid" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_include_diagrams_false(
-        self,
-        mock_session,
-        mock_llm_orchestrator,
-        sample_syllabus_point,
-        sample_student,
-        sample_llm_response,
-    ):
-        """Test that visual_aids excluded when include_diagrams=False."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-            include_diagrams=False,  # Exclude diagrams
-            include_practice=True,
-        )
-
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            json.dumps(sample_llm_response),
-            LLMProvider.ANTHROPIC,
-        )
-
-        # Act
-        result = await explain_concept(mock_session, request, mock_llm_orchestrator)
-
-        # Assert
-        assert len(result.visual_aids) == 0  # Excluded
+        assert message in str(exc_info.value)
 
     # NOTE: test_include_practice_false removed due to service implementation bug
     # The service tries to return empty list when include_practice=False,
     # but TopicExplanation schema requires min_length=3 for practice_problems.
     # This is a design issue that should be fixed in the service/schema layer.
 
-    @pytest.mark.asyncio
-    async def test_empty_learning_outcomes(
-        self,
-        mock_session,
-        mock_llm_orchestrator,
-        sample_syllabus_point,
-        sample_student,
-        sample_llm_response,
-    ):
-        """Test handling of syllabus point with no learning outcomes."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-        )
-
-        # Modify syllabus point to have None learning_outcomes
-        sample_syllabus_point.learning_outcomes = None
-
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            json.dumps(sample_llm_response),
-            LLMProvider.ANTHROPIC,
-        )
-
-        # Act
-        result = await explain_concept(mock_session, request, mock_llm_orchestrator)
-
-        # Assert
-        assert isinstance(result, TopicExplanation)
-        # Should still succeed despite missing learning outcomes
-
-    @pytest.mark.asyncio
     async def test_student_context_passed_to_prompt(
         self,
-        mock_session,
-        mock_llm_orchestrator,
         sample_syllabus_point,
         sample_student,
-        sample_llm_response,
     ):
         """Test that student context is passed to LLM prompt."""
         # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
+        request = _make_request(
+            sample_syllabus_point.id,
+            sample_student.id,
             context="Student struggles with graph interpretation",
         )
 
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
+        mock_session = _make_session(sample_syllabus_point, sample_student)
 
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            json.dumps(sample_llm_response),
-            LLMProvider.ANTHROPIC,
-        )
+        mock_llm_orchestrator = _make_orchestrator(_SAMPLE_LLM_RESPONSE_JSON)
 
         # Act
         result = await explain_concept(mock_session, request, mock_llm_orchestrator)
 
         # Assert
-        # Verify LLM was called (context would be in prompt)
-        mock_llm_orchestrator.generate_with_fallback.assert_called_once()
-        call_args = mock_llm_orchestrator.generate_with_fallback.call_args
-        prompt = call_args[1]["prompt"]
-        # Prompt should contain context (exact format depends on create_explanation_prompt)
-        assert isinstance(prompt, str)
-
-    @pytest.mark.asyncio
+        # One batched expectation pins the full call contract (context
+        # travels inside the prompt; its exact rendering is the prompt
+        # template's concern, not this test's)
+        mock_llm_orchestrator.generate_with_fallback.assert_called_once_with(
+            prompt=ANY,
+            temperature=ANY,
+            max_tokens=ANY,
+            system_prompt=ANY,
+        )
+
     async def test_llm_orchestrator_created_if_not_provided(
         self,
-        mock_session,
         sample_syllabus_point,
         sample_student,
-        sample_llm_response,
         monkeypatch,
     ):
-        """Test that LLMFallbackOrchestrator is created if not provided."""
+        """Test that the shared orchestrator is used if none is provided."""
         # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-        )
+        request = _make_request(sample_syllabus_point.id, sample_student.id)
 
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
+        mock_session = _make_session(sample_syllabus_point, sample_student)
 
-        # Mock LLMFallbackOrchestrator constructor
-        mock_orchestrator_class = Mock()
-        mock_orchestrator_instance = AsyncMock()
-        mock_orchestrator_instance.generate_with_fallback = AsyncMock(
-            return_value=(json.dumps(sample_llm_response), LLMProvider.ANTHROPIC)
+        # Mock the shared orchestrator getter
+        mock_get_orchestrator = Mock()
+        mock_orchestrator_instance = AsyncMock(spec=LLMFallbackOrchestrator)
+        mock_orchestrator_instance.generate_with_fallback.return_value = (
+            _SAMPLE_LLM_RESPONSE_JSON,
+            LLMProvider.ANTHROPIC,
         )
-        mock_orchestrator_class.return_value = mock_orchestrator_instance
+        mock_get_orchestrator.return_value = mock_orchestrator_instance
 
         monkeypatch.setattr(
-            "src.services.teaching_service.LLMFallbackOrchestrator",
-            mock_orchestrator_class,
+            "src.services.teaching_service.get_llm_orchestrator",
+            mock_get_orchestrator,
         )
 
         # Act
         result = await explain_concept(mock_session, request, llm_orchestrator=None)
 
         # Assert
-        mock_orchestrator_class.assert_called_once()
+        mock_get_orchestrator.assert_called_once()
         assert isinstance(result, TopicExplanation)
 
-    @pytest.mark.asyncio
-    async def test_gpt4_fallback_success(
-        self,
-        mock_session,
-        mock_llm_orchestrator,
-        sample_syllabus_point,
-        sample_student,
-        sample_llm_response,
-    ):
-        """Test successful fallback to GPT-4 when Claude fails."""
-        # Arrange
-        request = ExplainConceptRequest(
-            syllabus_point_id=sample_syllabus_point.id,
-            student_id=sample_student.id,
-        )
-
-        mock_session.exec.return_value.first.side_effect = [
-            sample_syllabus_point,
-            sample_student,
-        ]
-
-        # Mock LLM fallback to GPT-4
-        mock_llm_orchestrator.generate_with_fallback.return_value = (
-            json.dumps(sample_llm_response),
-            LLMProvider.OPENAI,  # Fell back to GPT-4
-        )
-
-        # Act
-        result = await explain_concept(mock_session, request, mock_llm_orchestrator)
-
-        # Assert
-        assert isinstance(result, TopicExplanation)
-        assert result.generated_by == LLMProvider.OPENAI.value